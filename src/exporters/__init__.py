@@ -1,6 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
 from .txt_exporter import TxtExporter
 from .srt_exporter import SrtExporter
 from .vtt_exporter import VttExporter
 from .json_exporter import JsonExporter
 
-__all__ = ['TxtExporter', 'SrtExporter', 'VttExporter', 'JsonExporter']
+__all__ = ['TxtExporter', 'SrtExporter', 'VttExporter', 'JsonExporter', 'export_all']
+
+# Format name -> exporter entry point
+_EXPORTERS = {
+    'txt': TxtExporter.export,
+    'srt': SrtExporter.export,
+    'vtt': VttExporter.export,
+    'json': JsonExporter.export,
+}
+
+
+def export_all(
+    video_item,
+    formats: Optional[list[str]] = None,
+    output_dir: Optional[Path] = None,
+) -> list[Path]:
+    """
+    Export a video item to several formats concurrently.
+
+    Each exporter is independent and dominated by formatting and file
+    I/O, so the formats are dispatched to a thread pool rather than run
+    back to back.
+
+    Args:
+        video_item: VideoItem with transcription segments
+        formats: Format names ('txt', 'srt', 'vtt', 'json').
+                 Defaults to all four.
+        output_dir: Optional directory for the output files. Defaults to
+                    the video's own directory.
+
+    Returns:
+        Paths to the exported files, in the same order as formats
+
+    Raises:
+        ValueError: If an unknown format name is given
+    """
+    if formats is None:
+        formats = list(_EXPORTERS)
+    elif not formats:
+        # ThreadPoolExecutor(max_workers=0) would raise an unrelated
+        # ValueError; nothing to export is simply an empty result
+        return []
+
+    unknown = [f for f in formats if f not in _EXPORTERS]
+    if unknown:
+        raise ValueError(f"Unknown export format(s): {', '.join(unknown)}")
+
+    if output_dir is not None:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    def _run(fmt: str) -> Path:
+        output_path = None
+        if output_dir is not None:
+            output_path = output_dir / f"{video_item.file_path.stem}.{fmt}"
+        return _EXPORTERS[fmt](video_item, output_path)
+
+    with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+        return list(executor.map(_run, formats))
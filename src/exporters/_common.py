@@ -0,0 +1,132 @@
+"""Shared helpers for the exporter modules."""
+
+import os
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def write_bytes_raw(path: Path, data: bytes) -> None:
+    """
+    Write preencoded bytes through a raw file descriptor.
+
+    Skips the buffered file-object layer (and its per-write locking) for
+    payloads that are already one bytes blob — ideally a single syscall,
+    looping only on partial writes.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def decompose_timestamp(seconds: float) -> tuple:
+    """
+    Split a second-offset into (hours, minutes, secs, millis) integers.
+
+    Pure integer arithmetic; JIT-compiled with Numba when it is
+    installed (optional, worthwhile only for very large exports).
+    """
+    t = int(seconds * 1000)
+    return t // 3_600_000, (t // 60_000) % 60, (t // 1000) % 60, t % 1000
+
+
+try:
+    from numba import njit
+except ImportError:
+    pass
+else:
+    decompose_timestamp = njit(cache=True)(decompose_timestamp)
+
+
+def resolve_output_path(video_item, output_path, suffix: str) -> Path:
+    """
+    Resolve the export target for a video item.
+
+    Defaults to the video's own path with `suffix` swapped in; otherwise
+    returns the caller's path, wrapping it in Path only when needed.
+    """
+    if output_path is None:
+        return video_item.file_path.with_suffix(suffix)
+    if isinstance(output_path, Path):
+        return output_path
+    return Path(output_path)
+
+
+def format_timestamps_bulk(
+    times,
+    sep: str = ',',
+    include_ms: bool = True,
+) -> list[str]:
+    """
+    Format many second-offsets to HH:MM:SS<sep>mmm strings in one pass.
+
+    Computes the hour/minute/second/millisecond components for the whole
+    batch with NumPy when available (a single vectorized pass instead of
+    per-segment divmod), falling back to a plain loop otherwise.
+
+    Args:
+        times: Times in seconds (list or NumPy array)
+        sep: Separator before milliseconds (',' for SRT, '.' for VTT)
+        include_ms: Whether to append the millisecond component
+
+    Returns:
+        List of formatted timestamp strings, one per input time
+    """
+    # Hoisted %-template: one substitution per stamp instead of four
+    # zero-padded __format__ dispatches
+    template = "%02d:%02d:%02d" + sep + "%03d" if include_ms else "%02d:%02d:%02d"
+
+    if np is not None and len(times):
+        ms = (np.asarray(times, dtype=np.float64) * 1000.0).astype(np.int64)
+        hours = (ms // 3_600_000).tolist()
+        minutes = ((ms // 60_000) % 60).tolist()
+        seconds = ((ms // 1000) % 60).tolist()
+        if not include_ms:
+            return [
+                template % (h, m, s)
+                for h, m, s in zip(hours, minutes, seconds)
+            ]
+        millis = (ms % 1000).tolist()
+        return [
+            template % (h, m, s, mm)
+            for h, m, s, mm in zip(hours, minutes, seconds, millis)
+        ]
+
+    result = []
+    for t in times:
+        total_ms = int(t * 1000)
+        h, rem = divmod(total_ms, 3_600_000)
+        m, rem = divmod(rem, 60_000)
+        s, mm = divmod(rem, 1000)
+        if include_ms:
+            result.append(template % (h, m, s, mm))
+        else:
+            result.append(template % (h, m, s))
+    return result
+
+
+def segment_columns(video_item) -> tuple:
+    """
+    Return (starts, ends, texts) for the item's segments.
+
+    Uses the columnar VideoItem.segment_array when present (timing
+    columns stay NumPy arrays for bulk formatting); otherwise extracts
+    the columns from the segments list.
+    """
+    array = video_item.segment_array
+    if array is not None:
+        return array.starts, array.ends, array.texts
+    segments = video_item.segments
+    return (
+        [s.start for s in segments],
+        [s.end for s in segments],
+        [s.text for s in segments],
+    )
@@ -1,11 +1,41 @@
 """JSON format exporter with full metadata."""
 
 import json
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..models.video_item import VideoItem
+from ._common import format_timestamps_bulk, resolve_output_path, write_bytes_raw
+
+
+def _dumps_bytes(data: Any, pretty_print: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty_print else 0
+        return orjson.dumps(data, option=option)
+    indent = 2 if pretty_print else None
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode('utf-8')
+
+
+def _plain_columns(video_item: VideoItem) -> tuple:
+    """Return (starts, ends, texts, confidences) as plain Python lists,
+    preferring the columnar segment_array when present."""
+    array = video_item.segment_array
+    if array is not None:
+        return array.columns()
+    segments = video_item.segments
+    return (
+        [s.start for s in segments],
+        [s.end for s in segments],
+        [s.text for s in segments],
+        [s.confidence for s in segments],
+    )
 
 
 class JsonExporter:
@@ -16,7 +46,8 @@ class JsonExporter:
         video_item: VideoItem,
         output_path: Optional[Path] = None,
         include_metadata: bool = True,
-        pretty_print: bool = True
+        pretty_print: bool = True,
+        include_formatted_timestamps: bool = False
     ) -> Path:
         """
         Export the transcript as a JSON file.
@@ -27,6 +58,9 @@ class JsonExporter:
                         filename with .json extension in same directory.
             include_metadata: Whether to include file metadata
             pretty_print: Whether to format JSON with indentation
+            include_formatted_timestamps: Whether to add start_formatted/
+                        end_formatted strings per segment (redundant with
+                        the numeric start/end; off by default)
 
         Returns:
             Path to the exported file
@@ -37,47 +71,193 @@ class JsonExporter:
         if not video_item.segments:
             raise ValueError("No transcription available to export")
 
-        # Generate output path if not provided
-        if output_path is None:
-            output_path = video_item.file_path.with_suffix('.json')
-        else:
-            output_path = Path(output_path)
-
-        # Build the JSON structure
-        data: dict[str, Any] = {}
+        output_path = resolve_output_path(video_item, output_path, '.json')
 
+        metadata: Optional[dict[str, Any]] = None
         if include_metadata:
-            data["metadata"] = {
+            metadata = {
                 "source_file": str(video_item.file_path),
                 "filename": video_item.filename,
-                "exported_at": datetime.now().isoformat(),
+                "exported_at": round(time.time(), 3),
                 "total_segments": len(video_item.segments),
                 "total_duration": video_item.segments[-1].end if video_item.segments else 0,
             }
 
-        # Full text
-        data["text"] = video_item.full_text
+        starts, ends, texts, confidences = _plain_columns(video_item)
+        fmt_starts = fmt_ends = None
+        if include_formatted_timestamps:
+            fmt_starts = format_timestamps_bulk(starts)
+            fmt_ends = format_timestamps_bulk(ends)
+
+        # Strip once and reuse for both the full-text join and the
+        # segment entries (one pass instead of two); seed the VideoItem's
+        # full_text cache while we're at it
+        stripped = [t.strip() for t in texts]
+        full_text = video_item.__dict__.get('full_text')
+        if full_text is None:
+            full_text = " ".join(stripped)
+            video_item.__dict__['full_text'] = full_text
+
+        def entries():
+            """Yield one serializable dict per non-empty segment."""
+            for i, text in enumerate(stripped):
+                if not text:
+                    continue
+                entry = {
+                    "id": i,
+                    "start": starts[i],
+                    "end": ends[i],
+                    "text": text,
+                    "confidence": confidences[i],
+                    "duration": ends[i] - starts[i],
+                }
+                if fmt_starts is not None:
+                    entry["start_formatted"] = fmt_starts[i]
+                    entry["end_formatted"] = fmt_ends[i]
+                yield entry
+
+        # Stream the document segment-by-segment instead of serializing one
+        # giant dict, so peak memory stays constant on very long transcripts.
+        with output_path.open('wb', buffering=1 << 20) as f:
+            if pretty_print:
+                f.write(b'{\n')
+                if metadata is not None:
+                    f.write(b'  "metadata": ')
+                    f.write(_dumps_bytes(metadata).replace(b'\n', b'\n  '))
+                    f.write(b',\n')
+                f.write(b'  "text": ')
+                f.write(_dumps_bytes(full_text, pretty_print=False))
+                f.write(b',\n  "segments": [')
+                first = True
+                for entry in entries():
+                    f.write(b'\n    ' if first else b',\n    ')
+                    first = False
+                    f.write(_dumps_bytes(entry, pretty_print=False))
+                f.write(b'\n  ]\n}' if not first else b']\n}')
+            else:
+                f.write(b'{')
+                if metadata is not None:
+                    f.write(b'"metadata":')
+                    f.write(_dumps_bytes(metadata, pretty_print=False))
+                    f.write(b',')
+                f.write(b'"text":')
+                f.write(_dumps_bytes(full_text, pretty_print=False))
+                f.write(b',"segments":[')
+                first = True
+                for entry in entries():
+                    if not first:
+                        f.write(b',')
+                    first = False
+                    f.write(_dumps_bytes(entry, pretty_print=False))
+                f.write(b']}')
+
+        return output_path
+
+    @staticmethod
+    def export_columnar(
+        video_item: VideoItem,
+        output_path: Optional[Path] = None,
+        include_metadata: bool = True,
+        pretty_print: bool = True
+    ) -> Path:
+        """
+        Export with columnar segments (one array per field).
+
+        Instead of a list of per-segment objects, "segments" is a dict of
+        parallel arrays: {"id": [...], "start": [...], "end": [...],
+        "text": [...], "confidence": [...]}. With orjson and NumPy
+        available the numeric columns are serialized straight from the
+        array buffers (OPT_SERIALIZE_NUMPY), skipping per-value Python
+        float boxing — much faster and smaller for long transcripts.
+
+        Args:
+            video_item: VideoItem with transcription segments
+            output_path: Optional output path. If not provided, uses video
+                        filename with _columnar.json suffix
+            include_metadata: Whether to include file metadata
+            pretty_print: Whether to format JSON with indentation
+
+        Returns:
+            Path to the exported file
+
+        Raises:
+            ValueError: If video has no transcription
+        """
+        if not video_item.segments:
+            raise ValueError("No transcription available to export")
+
+        if output_path is None:
+            output_path = video_item.file_path.with_name(
+                f"{video_item.file_path.stem}_columnar.json"
+            )
+        elif not isinstance(output_path, Path):
+            output_path = Path(output_path)
+
+        array = video_item.segment_array
+        if array is not None:
+            starts, ends, texts, confidences = (
+                array.starts, array.ends, array.texts, array.confidences
+            )
+        else:
+            starts, ends, texts, confidences = _plain_columns(video_item)
+
+        # Same cleanup as the row-wise exports: texts are stripped and
+        # whitespace-only rows dropped; ids keep the original segment
+        # indices so they still line up with video_item.segments
+        stripped = [t.strip() for t in texts]
+        keep = [i for i, t in enumerate(stripped) if t]
+        if len(keep) != len(stripped):
+            texts = [stripped[i] for i in keep]
+            if type(starts) is list:
+                starts = [starts[i] for i in keep]
+                ends = [ends[i] for i in keep]
+                confidences = [confidences[i] for i in keep]
+            else:
+                starts = starts[keep]
+                ends = ends[keep]
+                confidences = confidences[keep]
+        else:
+            texts = stripped
+
+        ids: Any = keep
+        if orjson is not None and type(starts) is not list:
+            # ndarray columns: let orjson read the buffers directly
+            import numpy as np
+            ids = np.asarray(keep)
+            option = orjson.OPT_SERIALIZE_NUMPY
+            if pretty_print:
+                option |= orjson.OPT_INDENT_2
+        else:
+            # Plain-list columns (or no orjson): normalize for json/orjson
+            if type(starts) is not list:
+                starts = starts.tolist()
+                ends = ends.tolist()
+                confidences = confidences.tolist()
+            option = None
 
-        # Segments with timestamps
-        data["segments"] = [
-            {
-                "id": i,
-                "start": segment.start,
-                "end": segment.end,
-                "start_formatted": segment.start_timestamp,
-                "end_formatted": segment.end_timestamp,
-                "text": segment.text.strip(),
-                "confidence": segment.confidence,
-                "duration": segment.duration,
+        data: dict[str, Any] = {}
+        if include_metadata:
+            data["metadata"] = {
+                "source_file": str(video_item.file_path),
+                "filename": video_item.filename,
+                "exported_at": round(time.time(), 3),
+                "total_segments": len(texts),
+                "total_duration": video_item.segments[-1].end,
             }
-            for i, segment in enumerate(video_item.segments)
-            if segment.text.strip()
-        ]
+        data["text"] = video_item.full_text
+        data["segments"] = {
+            "id": ids,
+            "start": starts,
+            "end": ends,
+            "text": texts,
+            "confidence": confidences,
+        }
 
-        # Write to file
-        indent = 2 if pretty_print else None
-        content = json.dumps(data, indent=indent, ensure_ascii=False)
-        output_path.write_text(content, encoding='utf-8')
+        if option is not None:
+            payload = orjson.dumps(data, option=option)
+        else:
+            payload = _dumps_bytes(data, pretty_print=pretty_print)
+        write_bytes_raw(output_path, payload)
 
         return output_path
 
@@ -103,21 +283,73 @@ class JsonExporter:
             output_path = video_item.file_path.with_name(
                 f"{video_item.file_path.stem}_segments.json"
             )
-        else:
+        elif not isinstance(output_path, Path):
             output_path = Path(output_path)
 
-        segments = [
-            {
-                "start": segment.start,
-                "end": segment.end,
-                "text": segment.text.strip(),
-            }
-            for segment in video_item.segments
-            if segment.text.strip()
-        ]
+        starts, ends, texts, _ = _plain_columns(video_item)
+
+        # Stream one segment object at a time, matching the full export
+        with output_path.open('wb', buffering=1 << 20) as f:
+            f.write(b'[')
+            first = True
+            for i, raw_text in enumerate(texts):
+                text = raw_text.strip()
+                if not text:
+                    continue
+                f.write(b'\n  ' if first else b',\n  ')
+                first = False
+                f.write(_dumps_bytes(
+                    {
+                        "start": starts[i],
+                        "end": ends[i],
+                        "text": text,
+                    },
+                    pretty_print=False
+                ))
+            f.write(b'\n]' if not first else b']')
+
+        return output_path
+
+    @staticmethod
+    def export_ndjson(
+        video_item: VideoItem,
+        output_path: Optional[Path] = None
+    ) -> Path:
+        """
+        Export segments as newline-delimited JSON (one object per line).
+
+        NDJSON lets consumers parse segment-by-segment without loading
+        the whole document, and skips the enclosing array/indentation
+        overhead — both producer and consumer stay constant-memory.
 
-        content = json.dumps(segments, indent=2, ensure_ascii=False)
-        output_path.write_text(content, encoding='utf-8')
+        Args:
+            video_item: VideoItem with transcription segments
+            output_path: Optional output path. If not provided, uses video
+                        filename with .ndjson extension
+
+        Returns:
+            Path to the exported file
+
+        Raises:
+            ValueError: If video has no transcription
+        """
+        if not video_item.segments:
+            raise ValueError("No transcription available to export")
+
+        output_path = resolve_output_path(video_item, output_path, '.ndjson')
+
+        starts, ends, texts, _ = _plain_columns(video_item)
+
+        with output_path.open('wb', buffering=1 << 20) as f:
+            for i, raw_text in enumerate(texts):
+                text = raw_text.strip()
+                if not text:
+                    continue
+                f.write(_dumps_bytes(
+                    {"start": starts[i], "end": ends[i], "text": text},
+                    pretty_print=False
+                ))
+                f.write(b'\n')
 
         return output_path
 
@@ -132,19 +364,23 @@ class JsonExporter:
         Returns:
             Dictionary representation
         """
+        starts, ends, texts, confidences = _plain_columns(video_item)
+        segments = []
+        for i, raw_text in enumerate(texts):
+            text = raw_text.strip()
+            if not text:
+                continue
+            segments.append({
+                "start": starts[i],
+                "end": ends[i],
+                "text": text,
+                "confidence": confidences[i],
+            })
+
         return {
             "source_file": str(video_item.file_path),
             "filename": video_item.filename,
             "status": video_item.status.value,
             "text": video_item.full_text,
-            "segments": [
-                {
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text.strip(),
-                    "confidence": segment.confidence,
-                }
-                for segment in video_item.segments
-                if segment.text.strip()
-            ]
+            "segments": segments,
         }
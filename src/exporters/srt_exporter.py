@@ -4,6 +4,12 @@ from pathlib import Path
 from typing import Optional
 
 from ..models.video_item import VideoItem
+from ._common import (
+    decompose_timestamp,
+    format_timestamps_bulk,
+    resolve_output_path,
+    segment_columns,
+)
 
 
 class SrtExporter:
@@ -20,12 +26,9 @@ class SrtExporter:
         Returns:
             Formatted timestamp string
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        milliseconds = int((seconds % 1) * 1000)
-
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
+        # Integer decomposition (JIT-compiled when Numba is installed),
+        # then one %-template substitution
+        return "%02d:%02d:%02d,%03d" % decompose_timestamp(seconds)
 
     @staticmethod
     def export(video_item: VideoItem, output_path: Optional[Path] = None) -> Path:
@@ -55,36 +58,29 @@ class SrtExporter:
         if not video_item.segments:
             raise ValueError("No transcription available to export")
 
-        # Generate output path if not provided
-        if output_path is None:
-            output_path = video_item.file_path.with_suffix('.srt')
-        else:
-            output_path = Path(output_path)
-
-        # Build the SRT content
-        lines = []
-        for i, segment in enumerate(video_item.segments, start=1):
-            text = segment.text.strip()
-            if not text:
-                continue
-
-            # Sequence number
-            lines.append(str(i))
-
-            # Timestamps
-            start_ts = SrtExporter.format_timestamp(segment.start)
-            end_ts = SrtExporter.format_timestamp(segment.end)
-            lines.append(f"{start_ts} --> {end_ts}")
-
-            # Text (can be multi-line, but we'll keep it simple)
-            lines.append(text)
-
-            # Blank line separator
-            lines.append("")
-
-        content = "\n".join(lines)
-
-        # Write to file
-        output_path.write_text(content, encoding='utf-8')
+        output_path = resolve_output_path(video_item, output_path, '.srt')
+
+        # Format all timestamps in one vectorized pass before the loop,
+        # preferring the columnar segment view when available
+        starts, ends, texts = segment_columns(video_item)
+        start_ts_list = format_timestamps_bulk(starts)
+        end_ts_list = format_timestamps_bulk(ends)
+
+        # Stream the SRT content through a buffered writer so peak memory
+        # stays at one cue instead of the whole file
+        with output_path.open('w', encoding='utf-8', buffering=1 << 20) as f:
+            first = True
+            for i, raw_text in enumerate(texts, start=1):
+                text = raw_text.strip()
+                if not text:
+                    continue
+
+                # Blank line separator between cues
+                if not first:
+                    f.write("\n")
+                first = False
+
+                # Sequence number, timestamps, text (can be multi-line, kept simple)
+                f.write(f"{i}\n{start_ts_list[i - 1]} --> {end_ts_list[i - 1]}\n{text}\n")
 
         return output_path
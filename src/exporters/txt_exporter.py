@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Optional
 
 from ..models.video_item import VideoItem
+from ._common import format_timestamps_bulk, resolve_output_path, segment_columns
 
 
 class TxtExporter:
@@ -33,28 +34,32 @@ class TxtExporter:
         if not video_item.segments:
             raise ValueError("No transcription available to export")
 
-        # Generate output path if not provided
-        if output_path is None:
-            output_path = video_item.file_path.with_suffix('.txt')
-        else:
-            output_path = Path(output_path)
-
-        # Build the transcript text with proper paragraph spacing
-        lines = []
-        for segment in video_item.segments:
-            text = segment.text.strip()
-            if text:
-                if include_timestamps:
-                    timestamp = f"[{segment.start_timestamp_simple}]"
-                    lines.append(f"{timestamp} {text}")
+        output_path = resolve_output_path(video_item, output_path, '.txt')
+
+        starts, _, texts = segment_columns(video_item)
+        timestamps = (
+            format_timestamps_bulk(starts, include_ms=False)
+            if include_timestamps else None
+        )
+
+        # Stream the transcript with proper paragraph spacing (double
+        # newlines between segments, matching the view) through a
+        # buffered writer instead of building the whole file in memory
+        with output_path.open('w', encoding='utf-8', buffering=1 << 20) as f:
+            first = True
+            for i, raw_text in enumerate(texts):
+                text = raw_text.strip()
+                if not text:
+                    continue
+
+                if not first:
+                    f.write("\n\n")
+                first = False
+
+                if timestamps is not None:
+                    f.write(f"[{timestamps[i]}] {text}")
                 else:
-                    lines.append(text)
-
-        # Join with double newlines for paragraph spacing (matches view)
-        content = "\n\n".join(lines)
-
-        # Write to file
-        output_path.write_text(content, encoding='utf-8')
+                    f.write(text)
 
         return output_path
 
@@ -80,17 +85,24 @@ class TxtExporter:
             output_path = video_item.file_path.with_name(
                 f"{video_item.file_path.stem}_timestamped.txt"
             )
-        else:
+        elif not isinstance(output_path, Path):
             output_path = Path(output_path)
 
-        lines = []
-        for segment in video_item.segments:
-            timestamp = f"[{segment.start_timestamp} --> {segment.end_timestamp}]"
-            text = segment.text.strip()
-            if text:
-                lines.append(f"{timestamp}\n{text}\n")
+        starts, ends, texts = segment_columns(video_item)
+        start_ts_list = format_timestamps_bulk(starts)
+        end_ts_list = format_timestamps_bulk(ends)
+
+        with output_path.open('w', encoding='utf-8', buffering=1 << 20) as f:
+            first = True
+            for i, raw_text in enumerate(texts):
+                text = raw_text.strip()
+                if not text:
+                    continue
+
+                if not first:
+                    f.write("\n")
+                first = False
 
-        content = "\n".join(lines)
-        output_path.write_text(content, encoding='utf-8')
+                f.write(f"[{start_ts_list[i]} --> {end_ts_list[i]}]\n{text}\n")
 
         return output_path
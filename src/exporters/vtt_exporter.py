@@ -4,6 +4,12 @@ from pathlib import Path
 from typing import Optional
 
 from ..models.video_item import VideoItem
+from ._common import (
+    decompose_timestamp,
+    format_timestamps_bulk,
+    resolve_output_path,
+    segment_columns,
+)
 
 
 class VttExporter:
@@ -22,12 +28,9 @@ class VttExporter:
         Returns:
             Formatted timestamp string
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        milliseconds = int((seconds % 1) * 1000)
-
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{milliseconds:03d}"
+        # Integer decomposition (JIT-compiled when Numba is installed),
+        # then one %-template substitution
+        return "%02d:%02d:%02d.%03d" % decompose_timestamp(seconds)
 
     @staticmethod
     def export(video_item: VideoItem, output_path: Optional[Path] = None) -> Path:
@@ -57,35 +60,26 @@ class VttExporter:
         if not video_item.segments:
             raise ValueError("No transcription available to export")
 
-        # Generate output path if not provided
-        if output_path is None:
-            output_path = video_item.file_path.with_suffix('.vtt')
-        else:
-            output_path = Path(output_path)
-
-        # Build the VTT content
-        lines = ["WEBVTT", ""]  # Header and blank line
-
-        for segment in video_item.segments:
-            text = segment.text.strip()
-            if not text:
-                continue
+        output_path = resolve_output_path(video_item, output_path, '.vtt')
 
-            # Timestamps (VTT doesn't require sequence numbers)
-            start_ts = VttExporter.format_timestamp(segment.start)
-            end_ts = VttExporter.format_timestamp(segment.end)
-            lines.append(f"{start_ts} --> {end_ts}")
+        # Format all timestamps in one vectorized pass before the loop,
+        # preferring the columnar segment view when available
+        starts, ends, texts = segment_columns(video_item)
+        start_ts_list = format_timestamps_bulk(starts, sep='.')
+        end_ts_list = format_timestamps_bulk(ends, sep='.')
 
-            # Text
-            lines.append(text)
+        # Stream the VTT content through a buffered writer so peak memory
+        # stays at one cue instead of the whole file
+        with output_path.open('w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write("WEBVTT\n")  # Header; blank line precedes each cue
 
-            # Blank line separator
-            lines.append("")
+            for i, raw_text in enumerate(texts):
+                text = raw_text.strip()
+                if not text:
+                    continue
 
-        content = "\n".join(lines)
-
-        # Write to file
-        output_path.write_text(content, encoding='utf-8')
+                # Timestamps (VTT doesn't require sequence numbers), then text
+                f.write(f"\n{start_ts_list[i]} --> {end_ts_list[i]}\n{text}\n")
 
         return output_path
 
@@ -109,31 +103,24 @@ class VttExporter:
         if not video_item.segments:
             raise ValueError("No transcription available to export")
 
-        if output_path is None:
-            output_path = video_item.file_path.with_suffix('.vtt')
-        else:
-            output_path = Path(output_path)
-
-        # Build VTT with metadata
-        lines = ["WEBVTT"]
+        output_path = resolve_output_path(video_item, output_path, '.vtt')
 
-        if title:
-            lines.append(f"Title: {title}")
+        starts, ends, texts = segment_columns(video_item)
+        start_ts_list = format_timestamps_bulk(starts, sep='.')
+        end_ts_list = format_timestamps_bulk(ends, sep='.')
 
-        lines.append("")  # Blank line after header
+        # Stream VTT with metadata
+        with output_path.open('w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write("WEBVTT\n")
 
-        for segment in video_item.segments:
-            text = segment.text.strip()
-            if not text:
-                continue
+            if title:
+                f.write(f"Title: {title}\n")
 
-            start_ts = VttExporter.format_timestamp(segment.start)
-            end_ts = VttExporter.format_timestamp(segment.end)
-            lines.append(f"{start_ts} --> {end_ts}")
-            lines.append(text)
-            lines.append("")
+            for i, raw_text in enumerate(texts):
+                text = raw_text.strip()
+                if not text:
+                    continue
 
-        content = "\n".join(lines)
-        output_path.write_text(content, encoding='utf-8')
+                f.write(f"\n{start_ts_list[i]} --> {end_ts_list[i]}\n{text}\n")
 
         return output_path
@@ -16,14 +16,15 @@ src_dir = Path(__file__).parent.parent
 if str(src_dir) not in sys.path:
     sys.path.insert(0, str(src_dir))
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
-
-from src.ui.main_window import MainWindow
-
-
 def main() -> int:
     """Main entry point for the application."""
+    # Deferred so importing this module (tests, CLI export use) doesn't
+    # pay the Qt binary load; only a GUI launch needs PySide6
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import Qt
+
+    from src.ui.main_window import MainWindow
+
     # Enable high DPI scaling
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
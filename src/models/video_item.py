@@ -2,9 +2,15 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class SegmentationMode:
     """Constants for segmentation mode."""
@@ -21,20 +27,34 @@ class TranscriptionStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionSegment:
-    """A single segment of transcribed text with timing information."""
+    """A single segment of transcribed text with timing information.
+
+    Slotted to keep per-segment memory low (long transcripts hold
+    thousands of these); the formatted-timestamp caches live in explicit
+    slots because slotted instances have no __dict__ for cached_property.
+    """
     start: float  # Start time in seconds
     end: float    # End time in seconds
     text: str     # Transcribed text
     confidence: float = 1.0  # Confidence score (0-1)
 
+    # Lazily populated timestamp caches
+    _start_ts: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _end_ts: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _start_ts_simple: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _end_ts_simple: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _start_ts_vtt: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _end_ts_vtt: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def duration(self) -> float:
         """Duration of the segment in seconds."""
         return self.end - self.start
 
-    def format_timestamp(self, time_seconds: float, include_ms: bool = True) -> str:
+    def format_timestamp(self, time_seconds: float, include_ms: bool = True,
+                         decimal_sep: str = ",") -> str:
         """Format a time in seconds to HH:MM:SS,mmm or HH:MM:SS.mmm format."""
         hours = int(time_seconds // 3600)
         minutes = int((time_seconds % 3600) // 60)
@@ -42,28 +62,94 @@ class TranscriptionSegment:
         milliseconds = int((time_seconds % 1) * 1000)
 
         if include_ms:
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+            return f"{hours:02d}:{minutes:02d}:{seconds:02d}{decimal_sep}{milliseconds:03d}"
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
     @property
     def start_timestamp(self) -> str:
         """Start time formatted as HH:MM:SS,mmm (for SRT/VTT export)."""
-        return self.format_timestamp(self.start)
+        if self._start_ts is None:
+            self._start_ts = self.format_timestamp(self.start)
+        return self._start_ts
 
     @property
     def end_timestamp(self) -> str:
         """End time formatted as HH:MM:SS,mmm (for SRT/VTT export)."""
-        return self.format_timestamp(self.end)
+        if self._end_ts is None:
+            self._end_ts = self.format_timestamp(self.end)
+        return self._end_ts
+
+    @property
+    def start_timestamp_vtt(self) -> str:
+        """Start time formatted as HH:MM:SS.mmm (for VTT display)."""
+        if self._start_ts_vtt is None:
+            self._start_ts_vtt = self.format_timestamp(self.start, decimal_sep=".")
+        return self._start_ts_vtt
+
+    @property
+    def end_timestamp_vtt(self) -> str:
+        """End time formatted as HH:MM:SS.mmm (for VTT display)."""
+        if self._end_ts_vtt is None:
+            self._end_ts_vtt = self.format_timestamp(self.end, decimal_sep=".")
+        return self._end_ts_vtt
 
     @property
     def start_timestamp_simple(self) -> str:
         """Start time formatted as HH:MM:SS (for display)."""
-        return self.format_timestamp(self.start, include_ms=False)
+        if self._start_ts_simple is None:
+            self._start_ts_simple = self.format_timestamp(self.start, include_ms=False)
+        return self._start_ts_simple
 
     @property
     def end_timestamp_simple(self) -> str:
         """End time formatted as HH:MM:SS (for display)."""
-        return self.format_timestamp(self.end, include_ms=False)
+        if self._end_ts_simple is None:
+            self._end_ts_simple = self.format_timestamp(self.end, include_ms=False)
+        return self._end_ts_simple
+
+
+@dataclass
+class SegmentArray:
+    """
+    Columnar (structure-of-arrays) view of transcription segments.
+
+    Holds the segment fields as four parallel arrays so exporters can
+    iterate plain values instead of attribute-loading N dataclass
+    instances. Timing columns are NumPy float64 arrays when NumPy is
+    available, plain lists otherwise.
+    """
+    starts: object
+    ends: object
+    texts: list[str]
+    confidences: object
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @classmethod
+    def from_segments(cls, segments: list[TranscriptionSegment]) -> "SegmentArray":
+        """Build the columnar view from a list of segments."""
+        starts = [s.start for s in segments]
+        ends = [s.end for s in segments]
+        texts = [s.text for s in segments]
+        confidences = [s.confidence for s in segments]
+        if np is not None:
+            starts = np.asarray(starts, dtype=np.float64)
+            ends = np.asarray(ends, dtype=np.float64)
+            # float64 like the timing columns: float32 round-trips
+            # through tolist()/JSON with representation noise
+            # (-0.2 becomes -0.20000000298023224)
+            confidences = np.asarray(confidences, dtype=np.float64)
+        return cls(starts=starts, ends=ends, texts=texts, confidences=confidences)
+
+    def columns(self) -> tuple[list[float], list[float], list[str], list[float]]:
+        """Return the four columns as plain Python lists."""
+        starts, ends, confidences = self.starts, self.ends, self.confidences
+        if np is not None and isinstance(starts, np.ndarray):
+            starts = starts.tolist()
+            ends = ends.tolist()
+            confidences = confidences.tolist()
+        return starts, ends, self.texts, confidences
 
 
 @dataclass
@@ -82,8 +168,11 @@ class VideoItem:
     segments: list[TranscriptionSegment] = field(default_factory=list)
     error_message: Optional[str] = None
     progress: float = 0.0  # 0-100
-    original_segments: list[TranscriptionSegment] = field(default_factory=list)
+    # Immutable so mode toggles can share the reference instead of
+    # copying thousands of segment references per switch
+    original_segments: tuple[TranscriptionSegment, ...] = ()
     word_data: list[WordTiming] = field(default_factory=list)
+    segment_array: Optional[SegmentArray] = None
 
     def __post_init__(self):
         """Ensure file_path is a Path object."""
@@ -95,11 +184,18 @@ class VideoItem:
         """Return just the filename without path."""
         return self.file_path.name
 
-    @property
+    @cached_property
     def full_text(self) -> str:
-        """Return the full transcript as a single string."""
+        """Return the full transcript as a single string (cached until
+        invalidate_text_cache is called)."""
         return " ".join(segment.text.strip() for segment in self.segments)
 
+    def invalidate_text_cache(self) -> None:
+        """Drop the caches derived from segments (full_text and the
+        columnar segment_array). Call after replacing segments."""
+        self.__dict__.pop('full_text', None)
+        self.segment_array = None
+
     @property
     def exists(self) -> bool:
         """Check if the video file exists."""
@@ -125,8 +221,10 @@ class VideoItem:
 
     def clear_transcription(self) -> None:
         """Clear the transcription data and reset status."""
+        self.invalidate_text_cache()
         self.segments = []
-        self.original_segments = []
+        self.original_segments = ()
+        self.segment_array = None
         self.word_data = []
         self.status = TranscriptionStatus.PENDING
         self.error_message = None
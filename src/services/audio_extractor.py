@@ -35,6 +35,12 @@ class AudioExtractor:
         '.mp3', '.wav', '.m4a', '.aac', '.ogg', '.flac', '.wma'
     }
 
+    # Union of the two, frozen once so a support check is a single
+    # membership test
+    SUPPORTED_EXTENSIONS = frozenset(
+        SUPPORTED_VIDEO_EXTENSIONS | SUPPORTED_AUDIO_EXTENSIONS
+    )
+
     def __init__(self):
         """Initialize the audio extractor."""
         self._temp_dir = tempfile.mkdtemp(prefix="video_transcript_")
@@ -42,9 +48,7 @@ class AudioExtractor:
     @classmethod
     def is_supported_file(cls, file_path: Path | str) -> bool:
         """Check if the file is a supported video or audio format."""
-        path = Path(file_path)
-        ext = path.suffix.lower()
-        return ext in cls.SUPPORTED_VIDEO_EXTENSIONS or ext in cls.SUPPORTED_AUDIO_EXTENSIONS
+        return Path(file_path).suffix.lower() in cls.SUPPORTED_EXTENSIONS
 
     @classmethod
     def is_audio_file(cls, file_path: Path | str) -> bool:
@@ -140,6 +144,19 @@ class AudioExtractor:
         except (KeyError, ValueError) as e:
             raise RuntimeError(f"Could not parse video duration: {e}") from e
 
+    def cleanup_file(self, audio_path: Path | str) -> None:
+        """
+        Remove a single extracted audio file.
+
+        Lets long batch runs free each item's WAV as soon as it has
+        been consumed instead of letting them pile up in the temp
+        directory until cleanup().
+        """
+        try:
+            Path(audio_path).unlink(missing_ok=True)
+        except OSError:
+            pass  # Ignore cleanup errors
+
     def cleanup(self) -> None:
         """Remove temporary files created during extraction."""
         import shutil
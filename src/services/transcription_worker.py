@@ -1,17 +1,21 @@
 """Transcription worker using QThread for non-blocking UI."""
 
-import re
+import os
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from time import monotonic
 from typing import Optional
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QThread, QTimer, Signal
 
-from ..models.video_item import VideoItem, TranscriptionSegment, TranscriptionStatus, SegmentationMode, WordTiming
+from ..models.video_item import VideoItem, TranscriptionSegment, TranscriptionStatus, SegmentationMode, SegmentArray, WordTiming
 from .audio_extractor import AudioExtractor
 from .model_manager import ModelManager, DEFAULT_MODEL
 
-# Sentence-ending punctuation pattern
-_SENTENCE_END_RE = re.compile(r'[.!?]$')
+# Sentence-ending punctuation (including CJK variants); a tuple
+# endswith check on the last character beats the regex engine here
+_SENTENCE_END = ('.', '!', '?', '\u3002', '\uff01', '\uff1f')
 
 
 def build_sentence_segments(word_data: list[WordTiming]) -> list[TranscriptionSegment]:
@@ -24,55 +28,191 @@ def build_sentence_segments(word_data: list[WordTiming]) -> list[TranscriptionSe
     if not word_data:
         return []
 
-    sentence_segments = []
-    current_words = []
-    sentence_start = None
-
+    # Pass 1: parallel arrays of stripped words and their timings,
+    # dropping whitespace-only entries. Column layout keeps the per-word
+    # work to a few list ops instead of per-sentence list churn.
+    starts: list[float] = []
+    ends: list[float] = []
+    words: list[str] = []
     for wt in word_data:
         word_text = wt.word.strip()
-        if not word_text:
-            continue
-
-        if sentence_start is None:
-            sentence_start = wt.start
-
-        current_words.append(word_text)
-
-        # Check if this word ends a sentence
-        if _SENTENCE_END_RE.search(word_text):
-            sentence_text = " ".join(current_words)
-            sentence_segments.append(TranscriptionSegment(
-                start=sentence_start,
-                end=wt.end,
-                text=sentence_text,
-            ))
-            current_words = []
-            sentence_start = None
-
-    # Handle remaining words (no sentence-ending punctuation)
-    if current_words:
-        last = word_data[-1]
+        if word_text:
+            starts.append(wt.start)
+            ends.append(wt.end)
+            words.append(word_text)
+
+    if not words:
+        return []
+
+    # Pass 2: sentence boundary indices; an unterminated tail becomes
+    # its own sentence ending at the last word
+    last_index = len(words) - 1
+    boundaries = [i for i, w in enumerate(words) if w.endswith(_SENTENCE_END)]
+    if not boundaries or boundaries[-1] != last_index:
+        boundaries.append(last_index)
+
+    # Pass 3: slice-and-join each sentence in bulk
+    sentence_segments = []
+    begin = 0
+    for boundary in boundaries:
         sentence_segments.append(TranscriptionSegment(
-            start=sentence_start if sentence_start is not None else last.start,
-            end=last.end,
-            text=" ".join(current_words),
+            start=starts[begin],
+            end=ends[boundary],
+            text=" ".join(words[begin:boundary + 1]),
         ))
+        begin = boundary + 1
 
     return sentence_segments
 
 
-def _store_word_data(video_item: VideoItem, raw_segments: list) -> None:
+def _run_transcription(
+    video_item: VideoItem,
+    model,
+    audio_path,
+    *,
+    beam_size: int,
+    vad_min_silence_ms: int,
+    vad_speech_pad_ms: int,
+    condition_on_previous_text: bool,
+    segment_mode: str,
+    progress_cb,
+    is_cancelled,
+    segments_cb=None,
+    batch_size: Optional[int] = None,
+) -> bool:
     """
-    Extract and store word timing data from raw Whisper segments onto the VideoItem.
-    Each raw segment should have a .words attribute (from word_timestamps=True).
+    Shared transcription core used by both workers.
+
+    Runs the model over the extracted audio, builds the segments, word
+    data and columnar view on the VideoItem, and applies sentence
+    resegmentation when requested. Reports through the callbacks:
+    progress_cb(video_item, pct, message), optional
+    segments_cb(video_item, segments) with buffered batches for live
+    preview, and is_cancelled() polled between segments.
+
+    Returns:
+        True when the item completed, False when cancelled mid-run
     """
-    word_data = []
-    for seg in raw_segments:
-        if hasattr(seg, 'words') and seg.words:
-            for w in seg.words:
-                word_data.append(WordTiming(start=w.start, end=w.end, word=w.word))
+    video_item.status = TranscriptionStatus.TRANSCRIBING
+    video_item.progress = 15.0
+    progress_cb(video_item, 15.0, "Transcribing...")
+
+    # Clear any previous segments
+    video_item.invalidate_text_cache()
+    video_item.segments = []
+
+    # Always use word_timestamps so segmentation modes can be switched
+    # after the fact. Greedy decoding by default; the temperature ladder
+    # re-decodes a segment at higher temperatures only when quality
+    # checks fail.
+    # batch_size is only meaningful for a BatchedInferencePipeline,
+    # which decodes VAD-split chunks in parallel
+    extra = {} if batch_size is None else {"batch_size": batch_size}
+    segments_iter, info = model.transcribe(
+        str(audio_path),
+        beam_size=beam_size,
+        **extra,
+        temperature=[0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
+        language=None,  # Auto-detect
+        vad_filter=True,  # Voice activity detection
+        vad_parameters=dict(
+            min_silence_duration_ms=vad_min_silence_ms,
+            speech_pad_ms=vad_speech_pad_ms,
+        ),
+        condition_on_previous_text=condition_on_previous_text,
+        word_timestamps=True,
+    )
+
+    # Get total duration for progress calculation
+    total_duration = info.duration if info.duration > 0 else 1.0
+
+    # Build segments in a local list (bound methods hoisted) and attach
+    # once after the loop; word timings are pulled out inline so the raw
+    # CT2 segments (and their Word objects) can be freed as the loop
+    # advances instead of pinning them all until the end
+    segments: list[TranscriptionSegment] = []
+    word_data: list[WordTiming] = []
+    add_segment = segments.append
+    extend_words = word_data.extend
+
+    # Debounce progress: every fine-grained segment emitting a queued
+    # cross-thread signal causes UI repaint storms on long videos
+    last_emit_pct = 0.0
+
+    # Buffer live-preview segments and flush at most every ~250ms
+    # (wall clock, since the worker thread runs no Qt event loop for a
+    # QTimer): one queued signal and one text relayout per flush instead
+    # of one per segment
+    flush_interval = 0.25
+    preview_buffer: list[TranscriptionSegment] = []
+    next_flush = monotonic() + flush_interval
+
+    for segment in segments_iter:
+        if is_cancelled():
+            return False
+
+        transcription_segment = TranscriptionSegment(
+            start=segment.start,
+            end=segment.end,
+            text=segment.text,
+            confidence=segment.avg_logprob
+        )
+        add_segment(transcription_segment)
+        extend_words(
+            WordTiming(start=w.start, end=w.end, word=w.word)
+            for w in segment.words or ()
+        )
+
+        if segments_cb is not None:
+            preview_buffer.append(transcription_segment)
+            now = monotonic()
+            if now >= next_flush:
+                segments_cb(video_item, preview_buffer)
+                preview_buffer = []
+                next_flush = now + flush_interval
+
+        # Calculate progress (15% to 95% range for transcription), but
+        # only emit (and build the status string) on >=1% steps
+        progress_pct = 15.0 + (segment.end / total_duration) * 80.0
+        progress_pct = min(progress_pct, 95.0)
+        video_item.progress = progress_pct
+        if progress_pct - last_emit_pct >= 1.0:
+            last_emit_pct = progress_pct
+            progress_cb(
+                video_item,
+                progress_pct,
+                f"Transcribing... ({int(segment.end)}/{int(total_duration)}s)"
+            )
+
+    if is_cancelled():
+        return False
+
+    if segments_cb is not None and preview_buffer:
+        segments_cb(video_item, preview_buffer)
+
+    # Attach the collected segments in one assignment, keeping the
+    # originals and word data for post-hoc mode switching
+    video_item.segments = segments
+    video_item.original_segments = tuple(segments)
     video_item.word_data = word_data
 
+    # Post-process: resegment by sentences if requested
+    if segment_mode == SegmentationMode.SENTENCE_LEVEL and word_data:
+        video_item.progress = 96.0
+        progress_cb(video_item, 96.0, "Resegmenting by sentences...")
+        sentence_segs = build_sentence_segments(word_data)
+        if sentence_segs:
+            video_item.segments = sentence_segs
+            video_item.invalidate_text_cache()
+
+    # Build the columnar view the exporters prefer
+    video_item.segment_array = SegmentArray.from_segments(video_item.segments)
+
+    video_item.status = TranscriptionStatus.COMPLETED
+    video_item.progress = 100.0
+    progress_cb(video_item, 100.0, "Complete")
+    return True
+
 
 class TranscriptionWorker(QThread):
     """
@@ -80,13 +220,13 @@ class TranscriptionWorker(QThread):
 
     Signals:
         progress: Emitted with (video_item, progress_percent, status_message)
-        segment_ready: Emitted when a new segment is transcribed
+        segments_ready: Emitted with a buffered batch of new segments
         completed: Emitted when transcription is complete
         error: Emitted when an error occurs
     """
 
     progress = Signal(VideoItem, float, str)
-    segment_ready = Signal(VideoItem, TranscriptionSegment)
+    segments_ready = Signal(VideoItem, list)
     completed = Signal(VideoItem)
     error = Signal(VideoItem, str)
 
@@ -96,6 +236,10 @@ class TranscriptionWorker(QThread):
         model_manager: ModelManager,
         model_name: str = DEFAULT_MODEL,
         segment_mode: str = SegmentationMode.NATURAL_PAUSES,
+        beam_size: int = 1,
+        vad_min_silence_ms: int = 500,
+        vad_speech_pad_ms: int = 400,
+        condition_on_previous_text: bool = False,
         parent=None
     ):
         """
@@ -106,6 +250,17 @@ class TranscriptionWorker(QThread):
             model_manager: Shared model manager instance
             model_name: Whisper model to use
             segment_mode: Segmentation mode (natural_pauses or sentence_level)
+            beam_size: Decoder beam size. Greedy (1) is ~3-4x faster than
+                      beam search for near-identical accuracy on clean,
+                      VAD-filtered audio; raise for difficult material
+            vad_min_silence_ms: Minimum silence (ms) before VAD splits;
+                      raising it skips more silent audio on sparse
+                      material like lectures
+            vad_speech_pad_ms: Padding (ms) kept around detected speech
+            condition_on_previous_text: Feed prior transcript tokens back
+                      into the decoder. Off by default: it makes later
+                      windows progressively slower on long audio and
+                      propagates hallucinations
             parent: Parent QObject
         """
         super().__init__(parent)
@@ -113,6 +268,10 @@ class TranscriptionWorker(QThread):
         self.model_manager = model_manager
         self.model_name = model_name
         self.segment_mode = segment_mode
+        self.beam_size = beam_size
+        self.vad_min_silence_ms = vad_min_silence_ms
+        self.vad_speech_pad_ms = vad_speech_pad_ms
+        self.condition_on_previous_text = condition_on_previous_text
         self._is_cancelled = False
         self._audio_extractor: Optional[AudioExtractor] = None
 
@@ -162,90 +321,30 @@ class TranscriptionWorker(QThread):
         self.video_item.progress = 10.0
         self.progress.emit(self.video_item, 10.0, "Loading model...")
 
-        # Load model (will use cached if already loaded)
-        model = self.model_manager.load_model(self.model_name)
+        # Load model (will use cached if already loaded) and wrap it in
+        # the batched pipeline for parallel chunk decoding
+        self.model_manager.load_model(self.model_name)
+        pipeline = self.model_manager.get_batched_pipeline()
 
         if self._is_cancelled:
             return
 
-        # Update status: transcribing
-        self.video_item.status = TranscriptionStatus.TRANSCRIBING
-        self.video_item.progress = 15.0
-        self.progress.emit(self.video_item, 15.0, "Transcribing...")
-
-        # Clear any previous segments
-        self.video_item.segments = []
-
-        # Always use word_timestamps so we can switch segmentation modes after the fact
-        segments_iter, info = model.transcribe(
-            str(audio_path),
-            beam_size=5,
-            language=None,  # Auto-detect
-            vad_filter=True,  # Voice activity detection
-            vad_parameters=dict(
-                min_silence_duration_ms=500,
-            ),
-            word_timestamps=True,
+        completed = _run_transcription(
+            self.video_item,
+            pipeline,
+            audio_path,
+            beam_size=self.beam_size,
+            vad_min_silence_ms=self.vad_min_silence_ms,
+            vad_speech_pad_ms=self.vad_speech_pad_ms,
+            condition_on_previous_text=self.condition_on_previous_text,
+            segment_mode=self.segment_mode,
+            progress_cb=self.progress.emit,
+            is_cancelled=lambda: self._is_cancelled,
+            segments_cb=self.segments_ready.emit,
+            batch_size=self.model_manager.get_batch_size(),
         )
-
-        # Get total duration for progress calculation
-        total_duration = info.duration if info.duration > 0 else 1.0
-
-        # Collect raw segments for word data extraction
-        raw_segments = []
-
-        # Process segments
-        for segment in segments_iter:
-            if self._is_cancelled:
-                return
-
-            raw_segments.append(segment)
-
-            # Create segment object
-            transcription_segment = TranscriptionSegment(
-                start=segment.start,
-                end=segment.end,
-                text=segment.text,
-                confidence=segment.avg_logprob if hasattr(segment, 'avg_logprob') else 1.0
-            )
-
-            # Add to video item
-            self.video_item.segments.append(transcription_segment)
-
-            # Emit segment signal for live preview
-            self.segment_ready.emit(self.video_item, transcription_segment)
-
-            # Calculate and emit progress (15% to 95% range for transcription)
-            progress_pct = 15.0 + (segment.end / total_duration) * 80.0
-            progress_pct = min(progress_pct, 95.0)
-            self.video_item.progress = progress_pct
-            self.progress.emit(
-                self.video_item,
-                progress_pct,
-                f"Transcribing... ({int(segment.end)}/{int(total_duration)}s)"
-            )
-
-        if self._is_cancelled:
-            return
-
-        # Store original segments and word data for post-hoc mode switching
-        self.video_item.original_segments = list(self.video_item.segments)
-        _store_word_data(self.video_item, raw_segments)
-
-        # Post-process: resegment by sentences if requested
-        use_sentence_mode = self.segment_mode == SegmentationMode.SENTENCE_LEVEL
-        if use_sentence_mode and self.video_item.word_data:
-            self.video_item.progress = 96.0
-            self.progress.emit(self.video_item, 96.0, "Resegmenting by sentences...")
-            sentence_segs = build_sentence_segments(self.video_item.word_data)
-            if sentence_segs:
-                self.video_item.segments = sentence_segs
-
-        # Complete
-        self.video_item.status = TranscriptionStatus.COMPLETED
-        self.video_item.progress = 100.0
-        self.progress.emit(self.video_item, 100.0, "Complete")
-        self.completed.emit(self.video_item)
+        if completed:
+            self.completed.emit(self.video_item)
 
 
 class BatchTranscriptionWorker(QThread):
@@ -272,6 +371,10 @@ class BatchTranscriptionWorker(QThread):
         model_manager: ModelManager,
         model_name: str = DEFAULT_MODEL,
         segment_mode: str = SegmentationMode.NATURAL_PAUSES,
+        beam_size: int = 1,
+        vad_min_silence_ms: int = 500,
+        vad_speech_pad_ms: int = 400,
+        condition_on_previous_text: bool = False,
         parent=None
     ):
         """
@@ -282,13 +385,42 @@ class BatchTranscriptionWorker(QThread):
             model_manager: Shared model manager instance
             model_name: Whisper model to use
             segment_mode: Segmentation mode (natural_pauses or sentence_level)
+            beam_size: Decoder beam size (1 = greedy, see
+                      TranscriptionWorker)
+            vad_min_silence_ms: Minimum silence (ms) before VAD splits
+            vad_speech_pad_ms: Padding (ms) kept around detected speech
+            condition_on_previous_text: Feed prior transcript tokens back
+                      into the decoder (see TranscriptionWorker)
             parent: Parent QObject
         """
         super().__init__(parent)
-        self.video_items = video_items
+
+        # Validate up front so missing/unreadable files never cost a
+        # thread spin-up and status round-trip; their errors are
+        # reported once the event loop runs (after signals connect)
+        self.video_items = []
+        unreadable = []
+        for item in video_items:
+            path = item.file_path
+            if path.exists() and os.access(path, os.R_OK):
+                self.video_items.append(item)
+            else:
+                unreadable.append(item)
+        if unreadable:
+            def _report_unreadable():
+                for item in unreadable:
+                    message = f"Video file not found or unreadable: {item.file_path}"
+                    item.set_error(message)
+                    self.item_error.emit(item, message)
+            QTimer.singleShot(0, _report_unreadable)
+
         self.model_manager = model_manager
         self.model_name = model_name
         self.segment_mode = segment_mode
+        self.beam_size = beam_size
+        self.vad_min_silence_ms = vad_min_silence_ms
+        self.vad_speech_pad_ms = vad_speech_pad_ms
+        self.condition_on_previous_text = condition_on_previous_text
         self._is_cancelled = False
         self._current_worker: Optional[TranscriptionWorker] = None
 
@@ -300,117 +432,311 @@ class BatchTranscriptionWorker(QThread):
 
     def run(self) -> None:
         """Run the batch transcription process."""
-        for video_item in self.video_items:
-            if self._is_cancelled:
-                break
-
-            # Skip already transcribed items
-            if video_item.is_transcribed:
-                continue
+        # Kick off the model load in the background: it is I/O + mmap
+        # for cached weights and overlaps with the first item's audio
+        # extraction instead of serializing ahead of it. Loaded once for
+        # the whole batch — per-item loads would repeat cache lookups
+        # and, if the name changed mid-run, evict and re-initialize the
+        # weights between items.
+        model_future = self.model_manager.preload_async(self.model_name)
+
+        # Skip already transcribed items and items with errors (retry by
+        # clearing the error first)
+        eligible = [
+            v for v in self.video_items
+            if not v.is_transcribed and not v.has_error
+        ]
+
+        # Pipeline: ffmpeg extraction is CPU/disk-bound while
+        # transcription runs on the GPU/CT2 threads, so extract item N+1
+        # in the background while item N transcribes. One shared
+        # extractor keeps a single temp dir for the whole batch.
+        audio_extractor = AudioExtractor()
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending: dict[int, Future] = {}
+                if eligible:
+                    pending[0] = executor.submit(
+                        audio_extractor.extract_audio, eligible[0].file_path
+                    )
+
+                try:
+                    model_future.result()
+                    model = self.model_manager.get_batched_pipeline()
+                except Exception as e:
+                    for video_item in eligible:
+                        video_item.set_error(str(e))
+                        self.item_error.emit(video_item, str(e))
+                    return
 
-            # Skip items with errors (allow retry by clearing error first)
-            if video_item.has_error:
-                continue
+                for i, video_item in enumerate(eligible):
+                    if self._is_cancelled:
+                        break
+
+                    # Kick off extraction for the next item before this
+                    # one starts transcribing
+                    if i + 1 < len(eligible):
+                        pending[i + 1] = executor.submit(
+                            audio_extractor.extract_audio, eligible[i + 1].file_path
+                        )
+
+                    self.item_started.emit(video_item)
+
+                    try:
+                        self._transcribe_single(
+                            video_item, model, pending.pop(i), audio_extractor
+                        )
+                        self.item_completed.emit(video_item)
+                    except Exception as e:
+                        video_item.set_error(str(e))
+                        self.item_error.emit(video_item, str(e))
+
+                for future in pending.values():
+                    future.cancel()
+        finally:
+            audio_extractor.cleanup()
+            self.batch_completed.emit()
 
-            self.item_started.emit(video_item)
+    def _transcribe_single(
+        self,
+        video_item: VideoItem,
+        model,
+        audio_future: Future,
+        audio_extractor: AudioExtractor
+    ) -> None:
+        """Transcribe a single video item synchronously."""
+        # Wait for the (possibly prefetched) audio extraction
+        video_item.status = TranscriptionStatus.EXTRACTING
+        video_item.progress = 5.0
+        self.item_progress.emit(video_item, 5.0, "Extracting audio...")
 
-            try:
-                self._transcribe_single(video_item)
-                self.item_completed.emit(video_item)
-            except Exception as e:
-                video_item.set_error(str(e))
-                self.item_error.emit(video_item, str(e))
+        audio_path = audio_future.result()
 
-        self.batch_completed.emit()
+        if self._is_cancelled:
+            return
 
-    def _transcribe_single(self, video_item: VideoItem) -> None:
-        """Transcribe a single video item synchronously."""
-        audio_extractor = None
         try:
-            # Extract audio
-            video_item.status = TranscriptionStatus.EXTRACTING
-            video_item.progress = 5.0
-            self.item_progress.emit(video_item, 5.0, "Extracting audio...")
-
-            if self._is_cancelled:
-                return
-
-            audio_extractor = AudioExtractor()
-            audio_path = audio_extractor.extract_audio(video_item.file_path)
-
-            if self._is_cancelled:
-                return
-
-            # Load model
-            video_item.progress = 10.0
-            self.item_progress.emit(video_item, 10.0, "Loading model...")
-            model = self.model_manager.load_model(self.model_name)
-
-            if self._is_cancelled:
-                return
-
-            # Transcribe
-            video_item.status = TranscriptionStatus.TRANSCRIBING
-            video_item.progress = 15.0
-            self.item_progress.emit(video_item, 15.0, "Transcribing...")
-
-            video_item.segments = []
-
-            # Always use word_timestamps for post-hoc mode switching
-            segments_iter, info = model.transcribe(
-                str(audio_path),
-                beam_size=5,
-                language=None,
-                vad_filter=True,
-                word_timestamps=True,
+            # Transcribe (model already loaded for the whole batch)
+            _run_transcription(
+                video_item,
+                model,
+                audio_path,
+                beam_size=self.beam_size,
+                vad_min_silence_ms=self.vad_min_silence_ms,
+                vad_speech_pad_ms=self.vad_speech_pad_ms,
+                condition_on_previous_text=self.condition_on_previous_text,
+                segment_mode=self.segment_mode,
+                progress_cb=self.item_progress.emit,
+                is_cancelled=lambda: self._is_cancelled,
+                batch_size=self.model_manager.get_batch_size(),
             )
+        finally:
+            # Free this item's WAV immediately; the temp dir itself is
+            # removed once the whole batch finishes
+            audio_extractor.cleanup_file(audio_path)
+
+
+class PersistentTranscriptionWorker(QThread):
+    """
+    Long-lived worker thread draining a queue of transcription jobs.
+
+    Spawning a fresh QThread per request pays OS thread creation on
+    every submission and gives up the warm pipeline between runs; a
+    single resident thread processes jobs in submission order and keeps
+    the Whisper model loaded across them (model loads go through the
+    ModelManager's LRU cache, so repeat submissions skip the multi-second
+    weight streaming entirely).
+
+    Signals:
+        item_started: Emitted when starting a new video
+        item_progress: Emitted with progress updates for the current video
+        segments_ready: Emitted with buffered segment batches for live preview
+        item_completed: Emitted when a video is completed
+        item_error: Emitted when a video has an error
+        job_completed: Emitted with the item count when a job finishes
+    """
+
+    item_started = Signal(VideoItem)
+    item_progress = Signal(VideoItem, float, str)
+    segments_ready = Signal(VideoItem, list)
+    item_completed = Signal(VideoItem)
+    item_error = Signal(VideoItem, str)
+    job_completed = Signal(int)
+
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        beam_size: int = 1,
+        vad_min_silence_ms: int = 500,
+        vad_speech_pad_ms: int = 400,
+        condition_on_previous_text: bool = False,
+        parent=None
+    ):
+        """
+        Initialize the persistent transcription worker.
+
+        Args:
+            model_manager: Shared model manager instance
+            beam_size: Decoder beam size (1 = greedy, see
+                      TranscriptionWorker)
+            vad_min_silence_ms: Minimum silence (ms) before VAD splits
+            vad_speech_pad_ms: Padding (ms) kept around detected speech
+            condition_on_previous_text: Feed prior transcript tokens back
+                      into the decoder (see TranscriptionWorker)
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.model_manager = model_manager
+        self.beam_size = beam_size
+        self.vad_min_silence_ms = vad_min_silence_ms
+        self.vad_speech_pad_ms = vad_speech_pad_ms
+        self.condition_on_previous_text = condition_on_previous_text
+        self._queue: queue.Queue = queue.Queue()
+        self._is_cancelled = False
+        self._busy = False
 
-            total_duration = info.duration if info.duration > 0 else 1.0
-            raw_segments = []
+    def submit(
+        self,
+        video_items: list[VideoItem],
+        model_name: str = DEFAULT_MODEL,
+        segment_mode: str = SegmentationMode.NATURAL_PAUSES
+    ) -> None:
+        """Queue a transcription job; jobs run in submission order."""
+        self._queue.put((list(video_items), model_name, segment_mode))
+
+    def is_busy(self) -> bool:
+        """Whether a job is currently running or queued."""
+        return self._busy or not self._queue.empty()
+
+    def cancel(self) -> None:
+        """Cancel the current job and drop any queued ones."""
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._is_cancelled = True
+
+    def stop(self) -> None:
+        """Cancel outstanding work and shut the thread down."""
+        self.cancel()
+        self._queue.put(None)
+
+    def run(self) -> None:
+        """Drain jobs until stop() enqueues the shutdown sentinel."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            self._is_cancelled = False
+            self._busy = True
+            try:
+                self._run_job(*job)
+            finally:
+                self._busy = False
 
-            for segment in segments_iter:
-                if self._is_cancelled:
+    def _run_job(
+        self,
+        video_items: list[VideoItem],
+        model_name: str,
+        segment_mode: str
+    ) -> None:
+        """Run one queued job (same pipelined flow as the batch worker)."""
+        # Report missing/unreadable files and skip items that are
+        # already done or errored
+        eligible = []
+        for item in video_items:
+            path = item.file_path
+            if not (path.exists() and os.access(path, os.R_OK)):
+                message = f"Video file not found or unreadable: {path}"
+                item.set_error(message)
+                self.item_error.emit(item, message)
+            elif not item.is_transcribed and not item.has_error:
+                eligible.append(item)
+
+        # Overlap the model load (a cache hit after the first job) with
+        # the first item's audio extraction
+        model_future = self.model_manager.preload_async(model_name)
+
+        audio_extractor = AudioExtractor()
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending: dict[int, Future] = {}
+                if eligible:
+                    pending[0] = executor.submit(
+                        audio_extractor.extract_audio, eligible[0].file_path
+                    )
+
+                try:
+                    model_future.result()
+                    model = self.model_manager.get_batched_pipeline()
+                except Exception as e:
+                    for video_item in eligible:
+                        video_item.set_error(str(e))
+                        self.item_error.emit(video_item, str(e))
                     return
 
-                raw_segments.append(segment)
-
-                transcription_segment = TranscriptionSegment(
-                    start=segment.start,
-                    end=segment.end,
-                    text=segment.text,
-                    confidence=segment.avg_logprob if hasattr(segment, 'avg_logprob') else 1.0
-                )
-                video_item.segments.append(transcription_segment)
-
-                progress_pct = 15.0 + (segment.end / total_duration) * 80.0
-                progress_pct = min(progress_pct, 95.0)
-                video_item.progress = progress_pct
-                self.item_progress.emit(
-                    video_item,
-                    progress_pct,
-                    f"Transcribing... ({int(segment.end)}/{int(total_duration)}s)"
-                )
-
-            if self._is_cancelled:
-                return
-
-            # Store original segments and word data for post-hoc mode switching
-            video_item.original_segments = list(video_item.segments)
-            _store_word_data(video_item, raw_segments)
-
-            # Post-process: resegment by sentences if requested
-            use_sentence_mode = self.segment_mode == SegmentationMode.SENTENCE_LEVEL
-            if use_sentence_mode and video_item.word_data:
-                video_item.progress = 96.0
-                self.item_progress.emit(video_item, 96.0, "Resegmenting by sentences...")
-                sentence_segs = build_sentence_segments(video_item.word_data)
-                if sentence_segs:
-                    video_item.segments = sentence_segs
-
-            video_item.status = TranscriptionStatus.COMPLETED
-            video_item.progress = 100.0
-            self.item_progress.emit(video_item, 100.0, "Complete")
+                for i, video_item in enumerate(eligible):
+                    if self._is_cancelled:
+                        break
+
+                    if i + 1 < len(eligible):
+                        pending[i + 1] = executor.submit(
+                            audio_extractor.extract_audio, eligible[i + 1].file_path
+                        )
+
+                    self.item_started.emit(video_item)
+
+                    try:
+                        completed = self._transcribe_one(
+                            video_item, model, segment_mode,
+                            pending.pop(i), audio_extractor
+                        )
+                        if completed:
+                            self.item_completed.emit(video_item)
+                    except Exception as e:
+                        video_item.set_error(str(e))
+                        self.item_error.emit(video_item, str(e))
+
+                for future in pending.values():
+                    future.cancel()
+        finally:
+            audio_extractor.cleanup()
+            self.job_completed.emit(len(eligible))
+
+    def _transcribe_one(
+        self,
+        video_item: VideoItem,
+        model,
+        segment_mode: str,
+        audio_future: Future,
+        audio_extractor: AudioExtractor
+    ) -> bool:
+        """Transcribe a single video item synchronously."""
+        video_item.status = TranscriptionStatus.EXTRACTING
+        video_item.progress = 5.0
+        self.item_progress.emit(video_item, 5.0, "Extracting audio...")
+
+        audio_path = audio_future.result()
+
+        if self._is_cancelled:
+            return False
 
+        try:
+            return _run_transcription(
+                video_item,
+                model,
+                audio_path,
+                beam_size=self.beam_size,
+                vad_min_silence_ms=self.vad_min_silence_ms,
+                vad_speech_pad_ms=self.vad_speech_pad_ms,
+                condition_on_previous_text=self.condition_on_previous_text,
+                segment_mode=segment_mode,
+                progress_cb=self.item_progress.emit,
+                is_cancelled=lambda: self._is_cancelled,
+                segments_cb=self.segments_ready.emit,
+                batch_size=self.model_manager.get_batch_size(),
+            )
         finally:
-            if audio_extractor:
-                audio_extractor.cleanup()
+            audio_extractor.cleanup_file(audio_path)
+
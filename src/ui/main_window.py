@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, Signal, Slot
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -22,11 +22,59 @@ from PySide6.QtWidgets import (
 
 from ..models.video_item import VideoItem, TranscriptionSegment, SegmentationMode
 from ..services.model_manager import ModelManager, AVAILABLE_MODELS, DEFAULT_MODEL
-from ..services.transcription_worker import TranscriptionWorker, BatchTranscriptionWorker, build_sentence_segments
+from ..services.transcription_worker import PersistentTranscriptionWorker, build_sentence_segments
 from .video_list_widget import VideoListWidget
 from .transcript_panel import TranscriptPanel
 
 
+# Formatted once at import; the model registry is static, so the
+# settings combo never needs to rebuild these strings
+_MODEL_LABELS = {
+    name: f"{name} ({info.size_mb}MB) - {info.description}"
+    for name, info in AVAILABLE_MODELS.items()
+}
+
+# Built once at import; the About dialog reuses it with no per-open
+# string concatenation
+_ABOUT_HTML = (
+    "<h3>Video to Transcript</h3>"
+    "<p>Desktop application for transcribing video files using local Whisper AI.</p>"
+    "<p><b>Features:</b></p>"
+    "<ul>"
+    "<li>Drag-and-drop video files</li>"
+    "<li>Batch transcription</li>"
+    "<li>Export to TXT, SRT, VTT, JSON</li>"
+    "<li>Local processing (no cloud required)</li>"
+    "</ul>"
+    "<p>Powered by faster-whisper and PySide6.</p>"
+)
+
+
+class _SegmentBuildSignals(QObject):
+    """Signal carrier for _SegmentBuildTask (QRunnable can't own signals)."""
+
+    segments_built = Signal(int, VideoItem, list)
+
+
+class _SegmentBuildTask(QRunnable):
+    """Runs build_sentence_segments on a pool thread.
+
+    For long videos the word-timing loop is a multi-thousand-iteration
+    Python pass; running it on the GUI thread stalls paint while the
+    checkbox toggle is handled.
+    """
+
+    def __init__(self, job_id: int, video_item: VideoItem):
+        super().__init__()
+        self.job_id = job_id
+        self.video_item = video_item
+        self.signals = _SegmentBuildSignals()
+
+    def run(self) -> None:
+        segments = build_sentence_segments(self.video_item.word_data)
+        self.signals.segments_built.emit(self.job_id, self.video_item, segments)
+
+
 class SettingsDialog(QDialog):
     """Settings dialog for configuring the application."""
 
@@ -42,13 +90,18 @@ class SettingsDialog(QDialog):
         form_layout = QFormLayout()
 
         self.model_combo = QComboBox()
-        for name, info in AVAILABLE_MODELS.items():
-            self.model_combo.addItem(
-                f"{name} ({info.size_mb}MB) - {info.description}",
-                name
-            )
-            if name == current_model:
-                self.model_combo.setCurrentIndex(self.model_combo.count() - 1)
+        # Populate in one batch: addItems triggers a single model reset
+        # instead of per-item insert signals, and the current index is
+        # resolved once instead of compared per iteration
+        keys = list(_MODEL_LABELS)
+        self.model_combo.blockSignals(True)
+        self.model_combo.addItems(list(_MODEL_LABELS.values()))
+        for index, name in enumerate(keys):
+            self.model_combo.setItemData(index, name)
+        index = self.model_combo.findData(current_model)
+        if index >= 0:
+            self.model_combo.setCurrentIndex(index)
+        self.model_combo.blockSignals(False)
 
         form_layout.addRow("Whisper Model:", self.model_combo)
 
@@ -88,12 +141,72 @@ class MainWindow(QMainWindow):
         # Services
         self._model_manager = ModelManager()
         self._current_model = DEFAULT_MODEL
-        self._current_worker: Optional[TranscriptionWorker | BatchTranscriptionWorker] = None
+        # One long-lived worker thread drains submitted jobs; no
+        # per-request thread spawn, and the Whisper model stays warm
+        # between submissions
+        self._worker = PersistentTranscriptionWorker(self._model_manager, parent=self)
+        # Mirrors the sentence-segments checkbox; reading the cached value
+        # avoids a Qt round-trip per worker start and pins the mode for
+        # the run even if the checkbox flips mid-batch
+        self._segment_mode = SegmentationMode.NATURAL_PAUSES
+        # Monotonic id for in-flight sentence-resegmentation jobs; a
+        # newer checkbox toggle supersedes any result still in the pool
+        self._seg_job_id = 0
+
+        # Dialogs are built once on first use and reused; reopening only
+        # resets state instead of repeating widget construction and layout
+        self._settings_dialog: Optional[SettingsDialog] = None
+        self._about_dialog: Optional[QMessageBox] = None
+
+        # Prebuilt cancel prompt: QMessageBox.question rebuilds the
+        # dialog (icon pixmap, buttons, layout) per call and blocks in
+        # exec(); open() shows this reusable instance without blocking
+        # the event loop, and the deferred start continues in
+        # _on_cancel_prompt_clicked
+        self._cancel_prompt = QMessageBox(self)
+        self._cancel_prompt.setIcon(QMessageBox.Icon.Question)
+        self._cancel_prompt.setWindowTitle("Transcription in Progress")
+        self._cancel_prompt.setText(
+            "A transcription is already in progress. Cancel it and start a new one?"
+        )
+        self._cancel_prompt.setStandardButtons(
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        self._cancel_prompt.buttonClicked.connect(self._on_cancel_prompt_clicked)
+        self._pending_start = None
+        # Set once closeEvent has started worker shutdown; the close is
+        # re-driven by the thread's finished signal
+        self._closing = False
+
+        # Status-bar messages are coalesced: slots record the latest
+        # message and a trailing-edge timer writes it once per 100ms,
+        # instead of a QStatusBar relayout per showMessage call
+        self._pending_status: Optional[str] = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setInterval(100)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._flush_status)
+
+        # Progress events are compressed to a latest-value-per-item
+        # holder drained at ~60Hz, so a worker emitting faster than the
+        # UI paints doesn't queue up widget updates that would be
+        # overwritten before ever being seen
+        self._latest_progress: dict[int, tuple[VideoItem, float, str]] = {}
+        self._progress_flush_timer = QTimer(self)
+        self._progress_flush_timer.setInterval(16)
+        self._progress_flush_timer.setSingleShot(True)
+        self._progress_flush_timer.timeout.connect(self._flush_progress)
 
         self._setup_ui()
         self._setup_menu()
         self._connect_signals()
 
+        # Build the heavy panels on the first event-loop pass so the
+        # window itself paints immediately
+        QTimer.singleShot(0, self._finish_ui)
+
+        self._worker.start()
+
     def _setup_ui(self) -> None:
         """Set up the user interface."""
         # Central widget with splitter
@@ -103,16 +216,12 @@ class MainWindow(QMainWindow):
         layout = QHBoxLayout(central_widget)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        # Splitter for resizable panels
+        # Splitter for resizable panels; the heavy panels are swapped in
+        # by _finish_ui after first paint, so startup shows an empty
+        # splitter instead of waiting on their construction
         self.splitter = QSplitter(Qt.Orientation.Horizontal)
-
-        # Left panel - Video list
-        self.video_list = VideoListWidget()
-        self.splitter.addWidget(self.video_list)
-
-        # Right panel - Transcript
-        self.transcript_panel = TranscriptPanel()
-        self.splitter.addWidget(self.transcript_panel)
+        self.splitter.addWidget(QWidget())
+        self.splitter.addWidget(QWidget())
 
         # Set initial sizes (1:2 ratio)
         self.splitter.setSizes([350, 700])
@@ -131,13 +240,12 @@ class MainWindow(QMainWindow):
         # File menu
         file_menu = menu_bar.addMenu("File")
 
-        add_files_action = file_menu.addAction("Add Files...")
-        add_files_action.setShortcut("Ctrl+O")
-        add_files_action.triggered.connect(self.video_list._on_add_files)
+        # Connected to the video list in _finish_ui once it exists
+        self._add_files_action = file_menu.addAction("Add Files...")
+        self._add_files_action.setShortcut("Ctrl+O")
 
-        add_folder_action = file_menu.addAction("Add Folder...")
-        add_folder_action.setShortcut("Ctrl+Shift+O")
-        add_folder_action.triggered.connect(self.video_list._on_add_folder)
+        self._add_folder_action = file_menu.addAction("Add Folder...")
+        self._add_folder_action.setShortcut("Ctrl+Shift+O")
 
         file_menu.addSeparator()
 
@@ -158,20 +266,63 @@ class MainWindow(QMainWindow):
         about_action = help_menu.addAction("About")
         about_action.triggered.connect(self._show_about)
 
-    def _connect_signals(self) -> None:
-        """Connect signals between components."""
-        # Video list signals
+    def _finish_ui(self) -> None:
+        """Construct the heavy panels after the window's first paint."""
+        # Left panel - Video list
+        self.video_list = VideoListWidget()
+        self.splitter.replaceWidget(0, self.video_list).deleteLater()
+
+        # Right panel - Transcript
+        self.transcript_panel = TranscriptPanel()
+        self.splitter.replaceWidget(1, self.transcript_panel).deleteLater()
+
+        self.splitter.setSizes([350, 700])
+
+        # Wiring that needs the real panels
+        self._add_files_action.triggered.connect(self.video_list._on_add_files)
+        self._add_folder_action.triggered.connect(self.video_list._on_add_folder)
         self.video_list.video_selected.connect(self._on_video_selected)
         self.video_list.transcribe_requested.connect(self._on_transcribe_requested)
-        self.video_list.sentence_segments_checkbox.stateChanged.connect(self._on_segment_mode_changed)
+        # toggled(bool) carries the new state directly (stateChanged's
+        # int would need another isChecked round-trip) and lets callers
+        # suppress the heavy resegmentation work on programmatic resets
+        # with a QSignalBlocker around setChecked
+        # Cache the mode first so _on_segment_mode_changed sees the new value
+        self.video_list.sentence_segments_checkbox.toggled.connect(self._cache_segment_mode)
+        self.video_list.sentence_segments_checkbox.toggled.connect(self._on_segment_mode_changed)
+
+    def _connect_signals(self) -> None:
+        """Connect signals between components."""
+        # Worker signals (connected once; the worker outlives all jobs)
+        self._worker.item_started.connect(self._on_item_started)
+        self._worker.item_progress.connect(
+            self._on_transcription_progress, Qt.ConnectionType.QueuedConnection
+        )
+        self._worker.segments_ready.connect(self._on_segments_ready)
+        self._worker.item_completed.connect(self._on_transcription_completed)
+        self._worker.item_error.connect(self._on_transcription_error)
+        self._worker.job_completed.connect(self._on_job_completed)
+
+    def _set_status(self, message: str) -> None:
+        """Queue a status-bar message, coalescing bursts into one write."""
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    @Slot()
+    def _flush_status(self) -> None:
+        """Write the most recent queued status-bar message."""
+        if self._pending_status is not None:
+            self.status_bar.showMessage(self._pending_status)
+            self._pending_status = None
 
     @Slot(VideoItem)
     def _on_video_selected(self, video_item: VideoItem) -> None:
         """Handle video selection."""
         self.transcript_panel.set_video(video_item)
 
-    @Slot(int)
-    def _on_segment_mode_changed(self, state: int) -> None:
+    @Slot(bool)
+    def _on_segment_mode_changed(self, checked: bool) -> None:
         """Handle sentence-level segments checkbox toggle.
 
         Re-segments the current video's transcript without re-transcribing,
@@ -181,46 +332,78 @@ class MainWindow(QMainWindow):
         if not current or not current.is_transcribed:
             return
 
-        if self.video_list.sentence_segments_checkbox.isChecked():
-            # Switch to sentence-level segments
+        # Any toggle supersedes resegmentation jobs still in flight
+        self._seg_job_id += 1
+
+        if self._segment_mode == SegmentationMode.SENTENCE_LEVEL:
+            # Switch to sentence-level segments: rebuild off the UI
+            # thread and apply the result in _on_sentence_segments_built
             if current.word_data:
-                sentence_segs = build_sentence_segments(current.word_data)
-                if sentence_segs:
-                    current.segments = sentence_segs
+                task = _SegmentBuildTask(self._seg_job_id, current)
+                task.signals.segments_built.connect(self._on_sentence_segments_built)
+                QThreadPool.globalInstance().start(task)
+            return
         else:
-            # Switch back to natural pauses
+            # Switch back to natural pauses. original_segments is an
+            # immutable tuple, so sharing the reference is safe —
+            # segments is only ever replaced wholesale, never mutated
             if current.original_segments:
-                current.segments = list(current.original_segments)
+                current.segments = current.original_segments
+                current.invalidate_text_cache()
 
         # Refresh transcript display
         self.transcript_panel._refresh_display()
 
+    @Slot(int, VideoItem, list)
+    def _on_sentence_segments_built(self, job_id: int, video_item: VideoItem, segments: list) -> None:
+        """Apply an asynchronously built sentence resegmentation."""
+        if job_id != self._seg_job_id or not segments:
+            return
+
+        video_item.segments = segments
+        video_item.invalidate_text_cache()
+        if self.transcript_panel._current_video is video_item:
+            self.transcript_panel._refresh_display()
+
     @Slot(list)
     def _on_transcribe_requested(self, video_items: list[VideoItem]) -> None:
         """Handle transcription request."""
         if not video_items:
             return
 
-        # Cancel any existing worker
-        if self._current_worker and self._current_worker.isRunning():
-            reply = QMessageBox.question(
-                self,
-                "Transcription in Progress",
-                "A transcription is already in progress. Cancel it and start a new one?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-            )
-            if reply == QMessageBox.StandardButton.No:
-                return
-            self._current_worker.cancel()
-            self._current_worker.wait()
+        # Existing job running: prompt without blocking the event loop
+        # and continue in _on_cancel_prompt_clicked
+        if self._worker.is_busy():
+            self._pending_start = lambda: self._start_transcription(video_items)
+            self._cancel_prompt.open()
+            return
 
-        # Filter out already transcribed items
-        items_to_transcribe = [
-            item for item in video_items
-            if not item.is_transcribed and not item.is_processing
-        ]
+        self._start_transcription(video_items)
 
-        if not items_to_transcribe:
+    def _on_cancel_prompt_clicked(self, button) -> None:
+        """Resume a deferred transcription start after the cancel prompt."""
+        pending = self._pending_start
+        self._pending_start = None
+        if self._cancel_prompt.standardButton(button) != QMessageBox.StandardButton.Yes:
+            return
+
+        # The queue serializes jobs, so the new submission simply runs
+        # once the cancelled one winds down — no blocking wait needed
+        self._worker.cancel()
+
+        if pending is not None:
+            pending()
+
+    def _start_transcription(self, video_items: list[VideoItem]) -> None:
+        """Filter the requested items and start the appropriate worker."""
+        # Short-circuit check: are any items still pending? Decides the
+        # re-transcribe prompt without building the filtered list twice
+        retranscribe = not any(
+            not item.is_transcribed and not item.is_processing
+            for item in video_items
+        )
+
+        if retranscribe:
             # All selected are already transcribed - offer to re-transcribe
             reply = QMessageBox.question(
                 self,
@@ -231,166 +414,153 @@ class MainWindow(QMainWindow):
             )
             if reply == QMessageBox.StandardButton.No:
                 return
-            # Clear transcriptions and re-transcribe
-            for item in video_items:
-                if not item.is_processing:
-                    item.clear_transcription()
-                    self.video_list.update_video_status(item)
-            items_to_transcribe = [
-                item for item in video_items
-                if not item.is_processing
-            ]
-            if not items_to_transcribe:
-                return
 
-        # Start transcription
-        if len(items_to_transcribe) == 1:
-            self._transcribe_single(items_to_transcribe[0])
-        else:
-            self._transcribe_batch(items_to_transcribe)
+        # Single pass: reset state (in the re-transcribe case) and
+        # collect the items to run, instead of re-filtering the list
+        # after clearing
+        items_to_transcribe = []
+        cleared = []
+        for item in video_items:
+            if item.is_processing:
+                continue
+            if retranscribe:
+                item.clear_transcription()
+                cleared.append(item)
+            elif item.is_transcribed:
+                continue
+            items_to_transcribe.append(item)
+
+        # One bulk view refresh instead of a per-item update
+        self.video_list.update_many(cleared)
 
-    def _get_segment_mode(self) -> str:
-        """Get the current segmentation mode from the checkbox."""
-        if self.video_list.sentence_segments_checkbox.isChecked():
-            return SegmentationMode.SENTENCE_LEVEL
-        return SegmentationMode.NATURAL_PAUSES
-
-    def _transcribe_single(self, video_item: VideoItem) -> None:
-        """Transcribe a single video."""
-        self.transcript_panel.set_video(video_item)
-
-        worker = TranscriptionWorker(
-            video_item=video_item,
-            model_manager=self._model_manager,
-            model_name=self._current_model,
-            segment_mode=self._get_segment_mode(),
-            parent=self
-        )
-
-        # Connect signals
-        worker.progress.connect(self._on_transcription_progress)
-        worker.segment_ready.connect(self._on_segment_ready)
-        worker.completed.connect(self._on_transcription_completed)
-        worker.error.connect(self._on_transcription_error)
-
-        self._current_worker = worker
-        worker.start()
-
-        self.status_bar.showMessage(f"Transcribing: {video_item.filename}")
+        if not items_to_transcribe:
+            return
 
-    def _transcribe_batch(self, video_items: list[VideoItem]) -> None:
-        """Transcribe multiple videos in batch."""
-        # Show first item
-        self.transcript_panel.set_video(video_items[0])
+        # Submit to the resident worker
+        self.transcript_panel.set_video(items_to_transcribe[0])
+        self._worker.submit(items_to_transcribe, self._current_model, self._segment_mode)
 
-        worker = BatchTranscriptionWorker(
-            video_items=video_items,
-            model_manager=self._model_manager,
-            model_name=self._current_model,
-            segment_mode=self._get_segment_mode(),
-            parent=self
+        if len(items_to_transcribe) == 1:
+            self._set_status(f"Transcribing: {items_to_transcribe[0].filename}")
+        else:
+            self._set_status(f"Batch transcription: {len(items_to_transcribe)} videos")
+
+    @Slot(bool)
+    def _cache_segment_mode(self, checked: bool) -> None:
+        """Keep the cached segmentation mode in sync with the checkbox."""
+        self._segment_mode = (
+            SegmentationMode.SENTENCE_LEVEL if checked
+            else SegmentationMode.NATURAL_PAUSES
         )
 
-        # Connect signals
-        worker.item_started.connect(self._on_batch_item_started)
-        worker.item_progress.connect(self._on_transcription_progress)
-        worker.item_completed.connect(self._on_batch_item_completed)
-        worker.item_error.connect(self._on_transcription_error)
-        worker.batch_completed.connect(self._on_batch_completed)
-
-        self._current_worker = worker
-        worker.start()
-
-        self.status_bar.showMessage(f"Batch transcription: {len(video_items)} videos")
-
     @Slot(VideoItem, float, str)
     def _on_transcription_progress(self, video_item: VideoItem, progress: float, status: str) -> None:
-        """Handle transcription progress updates."""
-        self.video_list.update_video_status(video_item)
-        self.transcript_panel.update_progress(video_item, progress, status)
-        self.status_bar.showMessage(f"{video_item.filename}: {status}")
+        """Record progress; widgets update from the ~60Hz flush timer."""
+        self._latest_progress[id(video_item)] = (video_item, progress, status)
+        if not self._progress_flush_timer.isActive():
+            self._progress_flush_timer.start()
 
-    @Slot(VideoItem, TranscriptionSegment)
-    def _on_segment_ready(self, video_item: VideoItem, segment: TranscriptionSegment) -> None:
-        """Handle new transcription segment."""
-        self.transcript_panel.append_segment(video_item, segment)
+    @Slot()
+    def _flush_progress(self) -> None:
+        """Apply the most recent progress per video to the widgets."""
+        updates = self._latest_progress
+        self._latest_progress = {}
+        for video_item, progress, status in updates.values():
+            self.video_list.update_video_status(video_item)
+            # Only the displayed item needs the panel's progress repaint;
+            # during batch runs the others are off-screen
+            if self.transcript_panel._current_video is video_item:
+                self.transcript_panel.update_progress(video_item, progress, status)
+            self._set_status(f"{video_item.filename}: {status}")
+
+    @Slot(VideoItem, list)
+    def _on_segments_ready(self, video_item: VideoItem, segments: list[TranscriptionSegment]) -> None:
+        """Handle a buffered batch of new transcription segments."""
+        # Don't touch the panel's QTextDocument for a video the user has
+        # navigated away from; the accumulated transcript renders via
+        # on_transcription_complete / set_video when they come back
+        if self.transcript_panel._current_video is not video_item:
+            return
+        self.transcript_panel.append_segments(video_item, segments)
 
     @Slot(VideoItem)
     def _on_transcription_completed(self, video_item: VideoItem) -> None:
         """Handle transcription completion."""
         self.video_list.update_video_status(video_item)
         self.transcript_panel.on_transcription_complete(video_item)
-        self.status_bar.showMessage(f"Completed: {video_item.filename}")
+        self._set_status(f"Completed: {video_item.filename}")
 
     @Slot(VideoItem, str)
     def _on_transcription_error(self, video_item: VideoItem, error: str) -> None:
         """Handle transcription error."""
         self.video_list.update_video_status(video_item)
         self.transcript_panel.on_transcription_error(video_item, error)
-        self.status_bar.showMessage(f"Error: {video_item.filename}")
+        self._set_status(f"Error: {video_item.filename}")
 
     @Slot(VideoItem)
-    def _on_batch_item_started(self, video_item: VideoItem) -> None:
-        """Handle batch item start."""
+    def _on_item_started(self, video_item: VideoItem) -> None:
+        """Show the item the worker just started on."""
         self.transcript_panel.set_video(video_item)
 
-    @Slot(VideoItem)
-    def _on_batch_item_completed(self, video_item: VideoItem) -> None:
-        """Handle batch item completion."""
-        self.video_list.update_video_status(video_item)
-        self.transcript_panel.on_transcription_complete(video_item)
-
-    @Slot()
-    def _on_batch_completed(self) -> None:
-        """Handle batch completion."""
-        self.status_bar.showMessage("Batch transcription complete")
-        QMessageBox.information(
-            self,
-            "Batch Complete",
-            "All videos have been transcribed."
-        )
+    @Slot(int)
+    def _on_job_completed(self, item_count: int) -> None:
+        """Handle job completion; only batches get the summary dialog."""
+        if item_count > 1:
+            self._set_status("Batch transcription complete")
+            QMessageBox.information(
+                self,
+                "Batch Complete",
+                "All videos have been transcribed."
+            )
 
     def _show_settings(self) -> None:
         """Show the settings dialog."""
-        dialog = SettingsDialog(self._current_model, self)
+        dialog = self._settings_dialog
+        if dialog is None:
+            dialog = self._settings_dialog = SettingsDialog(self._current_model, self)
+        else:
+            dialog.model_combo.setCurrentIndex(
+                dialog.model_combo.findData(self._current_model)
+            )
         if dialog.exec() == QDialog.DialogCode.Accepted:
             new_model = dialog.get_selected_model()
             if new_model != self._current_model:
                 self._current_model = new_model
-                self.status_bar.showMessage(f"Model changed to: {new_model}")
+                self._set_status(f"Model changed to: {new_model}")
 
     def _show_about(self) -> None:
         """Show the about dialog."""
-        QMessageBox.about(
-            self,
-            "About Video to Transcript",
-            "<h3>Video to Transcript</h3>"
-            "<p>Desktop application for transcribing video files using local Whisper AI.</p>"
-            "<p><b>Features:</b></p>"
-            "<ul>"
-            "<li>Drag-and-drop video files</li>"
-            "<li>Batch transcription</li>"
-            "<li>Export to TXT, SRT, VTT, JSON</li>"
-            "<li>Local processing (no cloud required)</li>"
-            "</ul>"
-            "<p>Powered by faster-whisper and PySide6.</p>"
-        )
+        if self._about_dialog is None:
+            dialog = QMessageBox(self)
+            dialog.setWindowTitle("About Video to Transcript")
+            dialog.setText(_ABOUT_HTML)
+            self._about_dialog = dialog
+        self._about_dialog.exec()
 
     def closeEvent(self, event) -> None:
         """Handle window close event."""
-        # Cancel any running worker
-        if self._current_worker and self._current_worker.isRunning():
-            reply = QMessageBox.question(
-                self,
-                "Transcription in Progress",
-                "A transcription is in progress. Quit anyway?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-            )
-            if reply == QMessageBox.StandardButton.No:
-                event.ignore()
-                return
-
-            self._current_worker.cancel()
-            self._current_worker.wait()
+        if self._worker.isRunning():
+            if not self._closing:
+                # Confirm if a job is still running
+                if self._worker.is_busy():
+                    reply = QMessageBox.question(
+                        self,
+                        "Transcription in Progress",
+                        "A transcription is in progress. Quit anyway?",
+                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                    )
+                    if reply == QMessageBox.StandardButton.No:
+                        event.ignore()
+                        return
+
+                # Shut down without blocking the GUI thread in wait()
+                # (which would freeze repaints until the job winds
+                # down); the thread's finished signal re-drives close
+                self._closing = True
+                self._worker.finished.connect(self.close)
+                self._worker.stop()
+
+            event.ignore()
+            return
 
         event.accept()
@@ -1,15 +1,20 @@
 """Transcript panel widget for displaying and exporting transcriptions."""
 
+import io
 import re
+from bisect import bisect_right
+from dataclasses import replace
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, QTimer, Signal
+from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import (
+    QApplication,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTextEdit,
+    QPlainTextEdit,
     QPushButton,
     QLabel,
     QProgressBar,
@@ -23,6 +28,56 @@ from PySide6.QtWidgets import (
 from ..models.video_item import VideoItem, TranscriptionSegment
 from ..exporters import TxtExporter, SrtExporter, VttExporter, JsonExporter
 
+# (name, extension, exporter) per format index, shared by the export
+# handlers; indices match the FORMAT_* constants and the combo order
+_FORMATS = (
+    ("TXT", ".txt", TxtExporter),
+    ("SRT", ".srt", SrtExporter),
+    ("VTT", ".vtt", VttExporter),
+    ("JSON", ".json", JsonExporter),
+)
+
+# Pattern matching the [HH:MM:SS] prefix of edited transcript lines;
+# compiled once at import instead of per edit-mode exit
+_TS_RE = re.compile(r'^\[(\d{2}):(\d{2}):(\d{2})\]\s*(.*)$')
+
+# orjson encodes in C several times faster than the stdlib encoder;
+# the preview re-serializes on checkbox/format toggles, so it pays off
+# on long transcripts. Falls back to the stdlib when unavailable.
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    import json
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+
+class _ExportSignals(QObject):
+    """Signals for _ExportTask (QRunnable cannot carry signals itself)."""
+    finished = Signal(object)  # payload returned by the export callable
+    failed = Signal(str)
+
+
+class _ExportTask(QRunnable):
+    """Runs an export callable in a pool thread and reports back."""
+
+    def __init__(self, fn):
+        super().__init__()
+        self.signals = _ExportSignals()
+        self._fn = fn
+
+    def run(self) -> None:
+        try:
+            result = self._fn()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
 
 class TranscriptPanel(QWidget):
     """
@@ -35,9 +90,18 @@ class TranscriptPanel(QWidget):
     FORMAT_VTT = 2
     FORMAT_JSON = 3
 
+    # Preview windowing for very long transcripts
+    PREVIEW_THRESHOLD = 3000  # windowing kicks in above this many segments
+    PREVIEW_WINDOW = 2000     # segments rendered at a time when windowed
+
+    # Approximate lines each segment occupies per format, used to keep
+    # the scroll position steady when the window slides (wrapped lines
+    # make this inexact, which is fine for a preview)
+    _BLOCKS_PER_ROW = {FORMAT_TXT: 2, FORMAT_SRT: 4, FORMAT_VTT: 3, FORMAT_JSON: 1}
+
     # Styles
     STYLE_NORMAL = """
-        QTextEdit {
+        QPlainTextEdit {
             border: 2px solid #ddd;
             border-radius: 4px;
             padding: 10px;
@@ -50,7 +114,7 @@ class TranscriptPanel(QWidget):
     """
 
     STYLE_EDIT_MODE = """
-        QTextEdit {
+        QPlainTextEdit {
             border: 2px solid #ff9800;
             border-radius: 4px;
             padding: 10px;
@@ -67,8 +131,34 @@ class TranscriptPanel(QWidget):
         super().__init__(parent)
         self._current_video: Optional[VideoItem] = None
         self._is_edit_mode = False
+        # (video_item, segments, rows) — see _segment_rows
+        self._fmt_cache: Optional[tuple] = None
+        # Preview windowing state — see _visible_rows
+        self._window_first = 0
+        self._window_offset = 0
+        self._windowed = False
+        self._scroll_guard = False
+        # (video_item, segments, format_idx, show_timestamps) of the
+        # last render; _refresh_display skips work when unchanged
+        self._last_rendered: Optional[tuple] = None
+        # Work deferred while the panel is hidden, flushed in showEvent
+        self._needs_refresh = False
+        self._pending_segments: list[tuple] = []
+        # Coalesces rapid format/checkbox toggles into a single render
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._refresh_display_now)
         self._setup_ui()
         self._connect_signals()
+        # Renderer per format index; the bool marks whether the
+        # renderer takes show_timestamps
+        self._renderers = (
+            (self._display_txt_format, True),
+            (self._display_srt_format, False),
+            (self._display_vtt_format, False),
+            (self._display_json_format, True),
+        )
 
     def _setup_ui(self) -> None:
         """Set up the user interface."""
@@ -165,8 +255,12 @@ class TranscriptPanel(QWidget):
         layout.addLayout(view_options_layout)
 
         # Transcript text area
-        self.transcript_text = QTextEdit()
+        # QPlainTextEdit's line-oriented layout scales to very large
+        # documents, unlike QTextEdit's rich-text QTextDocument which
+        # re-lays-out the whole body on each setText
+        self.transcript_text = QPlainTextEdit()
         self.transcript_text.setReadOnly(True)
+        self.transcript_text.setUndoRedoEnabled(False)
         self.transcript_text.setPlaceholderText(
             "Select a video and click 'Transcribe' to generate a transcript.\n\n"
             "Supported formats: MP4, MKV, AVI, MOV, WMV, FLV, WebM, and more."
@@ -241,6 +335,9 @@ class TranscriptPanel(QWidget):
         self.format_combo.currentIndexChanged.connect(self._on_format_changed)
         self.show_timestamps_checkbox.stateChanged.connect(self._on_timestamps_toggled)
         self.edit_btn.clicked.connect(self._on_edit_toggled)
+        self.transcript_text.verticalScrollBar().valueChanged.connect(
+            self._on_preview_scrolled
+        )
 
     def _on_edit_toggled(self) -> None:
         """Handle edit button toggle."""
@@ -255,6 +352,18 @@ class TranscriptPanel(QWidget):
             self.edit_btn.setChecked(False)
             return
 
+        # Edit mode needs the full text in the widget, which defeats the
+        # preview windowing on very long transcripts
+        if len(self._current_video.segments) > self.PREVIEW_THRESHOLD:
+            QMessageBox.information(
+                self,
+                "Transcript Too Long",
+                "This transcript is too long to edit in the preview.\n"
+                "Export it as TXT and edit it in an external editor."
+            )
+            self.edit_btn.setChecked(False)
+            return
+
         self._is_edit_mode = True
 
         # Show edit mode indicator
@@ -263,6 +372,9 @@ class TranscriptPanel(QWidget):
         # Change text area style and make editable
         self.transcript_text.setStyleSheet(self.STYLE_EDIT_MODE)
         self.transcript_text.setReadOnly(False)
+        # Undo stack only while actually editing; the read-only preview
+        # shouldn't pay for per-update undo bookkeeping
+        self.transcript_text.setUndoRedoEnabled(True)
 
         # Force TXT format with timestamps for editing
         self.format_combo.setCurrentIndex(self.FORMAT_TXT)
@@ -275,8 +387,12 @@ class TranscriptPanel(QWidget):
         self.export_all_btn.setEnabled(False)
         self.copy_btn.setEnabled(False)
 
-        # Display in editable format
+        # Display in editable format (bypasses _display_transcript, so
+        # the rendered-state key no longer matches the widget content)
+        self._last_rendered = None
         self._display_txt_format(self._current_video, show_timestamps=True)
+        # Let the document track whether the user actually types anything
+        self.transcript_text.document().setModified(False)
 
     def _exit_edit_mode(self) -> None:
         """Exit edit mode and save changes."""
@@ -294,6 +410,7 @@ class TranscriptPanel(QWidget):
         # Restore normal style and read-only
         self.transcript_text.setStyleSheet(self.STYLE_NORMAL)
         self.transcript_text.setReadOnly(True)
+        self.transcript_text.setUndoRedoEnabled(False)
 
         # Re-enable controls
         self.format_combo.setEnabled(True)
@@ -310,31 +427,54 @@ class TranscriptPanel(QWidget):
         if not self._current_video:
             return
 
+        # Leaving edit mode without typing is common; the document's
+        # modified flag spares re-parsing and rebuilding thousands of
+        # unchanged segments
+        if not self.transcript_text.document().isModified():
+            return
+
         text = self.transcript_text.toPlainText()
         lines = text.split("\n\n")
 
-        # Pattern to match [HH:MM:SS] timestamp
-        timestamp_pattern = re.compile(r'^\[(\d{2}):(\d{2}):(\d{2})\]\s*(.*)$')
+        # Timing columns built once; transcription segments are
+        # time-ordered, so each parsed line's end time resolves with one
+        # binary search instead of a linear scan per line
+        orig_starts = [s.start for s in self._current_video.segments]
+        orig_ends = [s.end for s in self._current_video.segments]
 
         new_segments = []
-        for i, line in enumerate(lines):
+        # Untimestamped lines merge into the previous segment; buffering
+        # them and joining once per segment keeps the merge linear
+        # instead of re-copying the accumulated text for every line
+        continuation: list[str] = []
+
+        def flush_continuation() -> None:
+            if continuation and new_segments:
+                prev = new_segments[-1]
+                new_segments[-1] = replace(
+                    prev, text=" ".join([prev.text, *continuation])
+                )
+            continuation.clear()
+
+        for line in lines:
             line = line.strip()
             if not line:
                 continue
 
-            match = timestamp_pattern.match(line)
+            match = _TS_RE.match(line)
             if match:
+                flush_continuation()
                 hours, minutes, seconds, text_content = match.groups()
                 start_time = int(hours) * 3600 + int(minutes) * 60 + int(seconds)
 
                 # Try to get end time from next segment, or estimate
                 end_time = start_time + 5  # Default 5 second duration
 
-                # Look for original segment with similar start time to get end time
-                for orig_seg in self._current_video.segments:
-                    if abs(orig_seg.start - start_time) < 2:  # Within 2 seconds
-                        end_time = orig_seg.end
-                        break
+                # Earliest original segment starting within 2 seconds
+                # (same match the old linear scan found)
+                idx = bisect_right(orig_starts, start_time - 2)
+                if idx < len(orig_starts) and orig_starts[idx] < start_time + 2:
+                    end_time = orig_ends[idx]
 
                 if text_content.strip():
                     new_segments.append(TranscriptionSegment(
@@ -346,14 +486,8 @@ class TranscriptPanel(QWidget):
             else:
                 # No timestamp - try to associate with previous segment's timing
                 if new_segments:
-                    # Append to previous segment
-                    prev = new_segments[-1]
-                    new_segments[-1] = TranscriptionSegment(
-                        start=prev.start,
-                        end=prev.end,
-                        text=prev.text + " " + line,
-                        confidence=prev.confidence
-                    )
+                    # Merge into previous segment once the run ends
+                    continuation.append(line)
                 elif self._current_video.segments:
                     # Use first original segment's timing
                     orig = self._current_video.segments[0]
@@ -364,9 +498,12 @@ class TranscriptPanel(QWidget):
                         confidence=1.0
                     ))
 
+        flush_continuation()
+
         # Update the video item's segments
         if new_segments:
             self._current_video.segments = new_segments
+            self._current_video.invalidate_text_cache()
 
     def _on_format_changed(self, index: int) -> None:
         """Handle format selection change - update preview and checkbox state."""
@@ -377,7 +514,10 @@ class TranscriptPanel(QWidget):
         requires_timestamps = index in (self.FORMAT_SRT, self.FORMAT_VTT)
 
         if requires_timestamps:
-            self.show_timestamps_checkbox.setChecked(True)
+            # setChecked on an already-checked box would still fire
+            # _on_timestamps_toggled and a redundant refresh
+            if not self.show_timestamps_checkbox.isChecked():
+                self.show_timestamps_checkbox.setChecked(True)
             self.show_timestamps_checkbox.setEnabled(False)
             self.show_timestamps_checkbox.setToolTip("Timestamps required for this format")
         else:
@@ -393,11 +533,40 @@ class TranscriptPanel(QWidget):
             self._refresh_display()
 
     def _refresh_display(self) -> None:
+        """Schedule a transcript re-render.
+
+        Arrow-keying through the format combo or rapidly clicking the
+        timestamps checkbox fires several change events back to back;
+        restarting a short single-shot timer collapses them into the
+        one render that runs once the input settles.
+        """
+        if self._is_edit_mode:
+            return
+        self._refresh_timer.start()
+
+    def _refresh_display_now(self) -> None:
         """Refresh the transcript display based on current settings."""
         if self._is_edit_mode:
             return
-        if self._current_video and self._current_video.is_transcribed:
-            self._display_transcript(self._current_video)
+        if not self.isVisible():
+            # Nobody can see the render; do it when the panel reappears
+            self._needs_refresh = True
+            return
+        video = self._current_video
+        if not (video and video.is_transcribed):
+            return
+
+        # Format-combo and checkbox handlers both land here; skip the
+        # re-render when nothing that feeds it has actually changed
+        last = self._last_rendered
+        if (last is not None
+                and last[0] is video
+                and last[1] is video.segments
+                and last[2] == self.format_combo.currentIndex()
+                and last[3] == self.show_timestamps_checkbox.isChecked()):
+            return
+
+        self._display_transcript(video)
 
     def set_video(self, video_item: VideoItem) -> None:
         """Set the current video item to display."""
@@ -407,6 +576,8 @@ class TranscriptPanel(QWidget):
             self._exit_edit_mode()
 
         self._current_video = video_item
+        self._pending_segments.clear()
+        self._window_first = 0
         self.video_name_label.setText(video_item.filename)
 
         # Update transcript display
@@ -434,86 +605,187 @@ class TranscriptPanel(QWidget):
         format_idx = self.format_combo.currentIndex()
         show_timestamps = self.show_timestamps_checkbox.isChecked()
 
-        if format_idx == self.FORMAT_TXT:
-            self._display_txt_format(video_item, show_timestamps)
-        elif format_idx == self.FORMAT_SRT:
-            self._display_srt_format(video_item)
-        elif format_idx == self.FORMAT_VTT:
-            self._display_vtt_format(video_item)
-        elif format_idx == self.FORMAT_JSON:
-            self._display_json_format(video_item, show_timestamps)
-
-    def _display_txt_format(self, video_item: VideoItem, show_timestamps: bool) -> None:
-        """Display as plain text format."""
-        lines = []
-        for segment in video_item.segments:
+        # setPlainText resets the scrollbar, which would otherwise feed
+        # back into _on_preview_scrolled and slide the window to the top;
+        # updates are suspended so the style/text/scroll changes paint as
+        # one pass instead of several relayouts
+        guard = self._scroll_guard
+        self._scroll_guard = True
+        self.transcript_text.setUpdatesEnabled(False)
+        try:
+            renderer, uses_timestamps = self._renderers[format_idx]
+            if uses_timestamps:
+                renderer(video_item, show_timestamps)
+            else:
+                renderer(video_item)
+            self._last_rendered = (
+                video_item, video_item.segments, format_idx, show_timestamps
+            )
+        finally:
+            self.transcript_text.setUpdatesEnabled(True)
+            self._scroll_guard = guard
+
+    def _segment_rows(self, video_item: VideoItem) -> list[tuple[TranscriptionSegment, str]]:
+        """(segment, stripped_text) pairs for non-empty segments, cached.
+
+        Segments are only ever replaced wholesale, so the attached list's
+        identity doubles as the invalidation token; while it is unchanged
+        repeat refreshes (format/timestamp toggles) skip the per-segment
+        stripping and empty filtering. The formatted timestamps are
+        cached on the segments themselves.
+        """
+        cached = self._fmt_cache
+        segments = video_item.segments
+        if cached is not None and cached[0] is video_item and cached[1] is segments:
+            return cached[2]
+
+        rows = []
+        for segment in segments:
             text = segment.text.strip()
             if text:
-                if show_timestamps:
-                    timestamp = f"[{segment.start_timestamp_simple}]"
-                    lines.append(f"{timestamp} {text}")
-                else:
-                    lines.append(text)
+                rows.append((segment, text))
+        self._fmt_cache = (video_item, segments, rows)
+        return rows
+
+    def _visible_rows(self, video_item: VideoItem) -> list[tuple[TranscriptionSegment, str]]:
+        """Slice of _segment_rows currently rendered in the preview.
+
+        Transcripts up to PREVIEW_THRESHOLD segments render in full.
+        Beyond that the widget holds only a PREVIEW_WINDOW-segment slice
+        and _on_preview_scrolled slides it, so the document stays a
+        bounded size on multi-hour transcripts instead of growing the
+        relayout cost with every segment. Edit mode never sees a window
+        because _enter_edit_mode rejects transcripts over the threshold.
+        """
+        rows = self._segment_rows(video_item)
+        if len(rows) <= self.PREVIEW_THRESHOLD:
+            self._windowed = False
+            self._window_offset = 0
+            return rows
+
+        first = max(0, min(self._window_first, len(rows) - self.PREVIEW_WINDOW))
+        self._window_first = first
+        self._window_offset = first
+        self._windowed = True
+        return rows[first:first + self.PREVIEW_WINDOW]
+
+    def _on_preview_scrolled(self, value: int) -> None:
+        """Slide the preview window when scrolling near either edge."""
+        if not self._windowed or self._scroll_guard or self._is_edit_mode:
+            return
+        if not self._current_video:
+            return
+
+        bar = self.transcript_text.verticalScrollBar()
+        maximum = bar.maximum()
+        if maximum <= 0:
+            return
+
+        total = len(self._segment_rows(self._current_video))
+        step = self.PREVIEW_WINDOW // 2
+        if value >= maximum - maximum // 20:
+            if self._window_first + self.PREVIEW_WINDOW < total:
+                self._shift_window(step)
+        elif value <= maximum // 20 and self._window_first > 0:
+            self._shift_window(-step)
+
+    def _shift_window(self, delta: int) -> None:
+        """Move the preview window by delta segments and re-render,
+        compensating the scrollbar so the visible text stays put."""
+        total = len(self._segment_rows(self._current_video))
+        old_first = self._window_first
+        new_first = max(0, min(old_first + delta, total - self.PREVIEW_WINDOW))
+        if new_first == old_first:
+            return
+
+        bar = self.transcript_text.verticalScrollBar()
+        old_value = bar.value()
+        self._window_first = new_first
+
+        self._scroll_guard = True
+        try:
+            self._display_transcript(self._current_video)
+            blocks = self._BLOCKS_PER_ROW[self.format_combo.currentIndex()]
+            bar.setValue(max(0, old_value - (new_first - old_first) * blocks))
+        finally:
+            self._scroll_guard = False
 
-        self.transcript_text.setText("\n\n".join(lines))
+    def _display_txt_format(self, video_item: VideoItem, show_timestamps: bool) -> None:
+        """Display as plain text format."""
+        # Stream into one geometrically-growing buffer instead of
+        # building a list of per-segment line strings and joining it
+        buf = io.StringIO()
+        write = buf.write
+        first = True
+        for segment, text in self._visible_rows(video_item):
+            if not first:
+                write("\n\n")
+            first = False
+            if show_timestamps:
+                write("[")
+                write(segment.start_timestamp_simple)
+                write("] ")
+            write(text)
+
+        self.transcript_text.setPlainText(buf.getvalue())
 
     def _display_srt_format(self, video_item: VideoItem) -> None:
         """Display as SRT subtitle format."""
-        lines = []
-        counter = 1
-        for segment in video_item.segments:
-            text = segment.text.strip()
-            if text:
-                lines.append(str(counter))
-                lines.append(f"{segment.start_timestamp} --> {segment.end_timestamp}")
-                lines.append(text)
-                lines.append("")
-                counter += 1
+        # One multi-line block per segment (the trailing newline plus the
+        # join separator forms the blank line between entries): a quarter
+        # of the list appends of the line-at-a-time version
+        blocks = [
+            f"{counter}\n"
+            f"{segment.start_timestamp} --> {segment.end_timestamp}\n"
+            f"{text}\n"
+            for counter, (segment, text) in enumerate(
+                self._visible_rows(video_item), start=self._window_offset + 1
+            )
+        ]
 
-        self.transcript_text.setText("\n".join(lines))
+        self.transcript_text.setPlainText("\n".join(blocks))
 
     def _display_vtt_format(self, video_item: VideoItem) -> None:
         """Display as WebVTT subtitle format."""
-        lines = ["WEBVTT", ""]
-        for segment in video_item.segments:
-            text = segment.text.strip()
-            if text:
-                # VTT uses period instead of comma for milliseconds
-                start_ts = segment.start_timestamp.replace(",", ".")
-                end_ts = segment.end_timestamp.replace(",", ".")
-                lines.append(f"{start_ts} --> {end_ts}")
-                lines.append(text)
-                lines.append("")
+        blocks = ["WEBVTT\n"]
+        for segment, text in self._visible_rows(video_item):
+            # VTT uses period instead of comma for milliseconds; the
+            # period form is formatted (and cached) directly instead of
+            # rewriting the comma form per segment per refresh
+            blocks.append(
+                f"{segment.start_timestamp_vtt} --> {segment.end_timestamp_vtt}\n{text}\n"
+            )
 
-        self.transcript_text.setText("\n".join(lines))
+        self.transcript_text.setPlainText("\n".join(blocks))
 
     def _display_json_format(self, video_item: VideoItem, show_timestamps: bool) -> None:
         """Display as JSON format preview."""
-        import json
-
+        # Serialize one small dict per segment instead of building the
+        # whole structure and pretty-printing it with indent=2, which
+        # allocates an intermediate list of dicts and spends most of its
+        # time inserting per-item whitespace. One compact segment per
+        # line keeps the preview readable; file export (JsonExporter)
+        # keeps the pretty-printed layout.
+        dumps = _json_dumps
         if show_timestamps:
-            data = {
-                "segments": [
-                    {
-                        "start": f"{segment.start_timestamp_simple}",
-                        "end": f"{segment.end_timestamp_simple}",
-                        "text": segment.text.strip()
-                    }
-                    for segment in video_item.segments
-                    if segment.text.strip()
-                ]
-            }
+            body = ",\n    ".join(
+                dumps({
+                    "start": segment.start_timestamp_simple,
+                    "end": segment.end_timestamp_simple,
+                    "text": text,
+                })
+                for segment, text in self._visible_rows(video_item)
+            )
+            preview = f'{{\n  "segments": [\n    {body}\n  ]\n}}'
         else:
-            data = {
-                "text": video_item.full_text,
-                "segments": [
-                    {"text": segment.text.strip()}
-                    for segment in video_item.segments
-                    if segment.text.strip()
-                ]
-            }
+            body = ",\n    ".join(
+                dumps({"text": text})
+                for _, text in self._visible_rows(video_item)
+            )
+            full_text = dumps(video_item.full_text)
+            preview = f'{{\n  "text": {full_text},\n  "segments": [\n    {body}\n  ]\n}}'
 
-        self.transcript_text.setText(json.dumps(data, indent=2, ensure_ascii=False))
+        self.transcript_text.setPlainText(preview)
 
     def _update_progress_display(self, video_item: VideoItem) -> None:
         """Update the progress bar and status label."""
@@ -530,8 +802,23 @@ class TranscriptPanel(QWidget):
         else:
             self.progress_group.hide()
 
+    def showEvent(self, event) -> None:
+        """Catch up on display work deferred while the panel was hidden."""
+        super().showEvent(event)
+        if self._pending_segments:
+            pending, self._pending_segments = self._pending_segments, []
+            for video_item, segments in pending:
+                self.append_segments(video_item, segments)
+        if self._needs_refresh:
+            self._needs_refresh = False
+            self._refresh_display()
+        if self._current_video:
+            self._update_progress_display(self._current_video)
+
     def update_progress(self, video_item: VideoItem, progress: float, status: str) -> None:
         """Update the progress display during transcription."""
+        if not self.isVisible():
+            return
         if self._current_video == video_item:
             self.progress_group.show()
             self.progress_bar.setValue(int(progress))
@@ -540,28 +827,55 @@ class TranscriptPanel(QWidget):
 
     def append_segment(self, video_item: VideoItem, segment: TranscriptionSegment) -> None:
         """Append a new segment to the live transcript display."""
-        if self._is_edit_mode:
+        self.append_segments(video_item, [segment])
+
+    def append_segments(self, video_item: VideoItem, segments: list[TranscriptionSegment]) -> None:
+        """
+        Append a batch of new segments to the live transcript display.
+
+        Inserts at the end of the document inside one edit block (a
+        single relayout/undo step) instead of rebuilding the whole text
+        per segment, which made live preview quadratic on long videos.
+        """
+        # Identity check: dataclass equality would deep-compare segment
+        # lists on every flush
+        if self._is_edit_mode or self._current_video is not video_item:
             return
-        if self._current_video == video_item:
+
+        # No point formatting and inserting text nobody can see (e.g. a
+        # batch transcription running behind a hidden window); queue the
+        # segments and flush them in showEvent
+        if not self.isVisible():
+            self._pending_segments.append((video_item, segments))
+            return
+
+        show_timestamps = self.show_timestamps_checkbox.isChecked()
+        lines = []
+        for segment in segments:
             text = segment.text.strip()
-            if text:
-                show_timestamps = self.show_timestamps_checkbox.isChecked()
-                if show_timestamps:
-                    timestamp = f"[{segment.start_timestamp_simple}]"
-                    new_line = f"{timestamp} {text}"
-                else:
-                    new_line = text
-
-                current_text = self.transcript_text.toPlainText()
-                if current_text:
-                    new_text = f"{current_text}\n\n{new_line}"
-                else:
-                    new_text = new_line
-                self.transcript_text.setText(new_text)
-
-                # Scroll to bottom
-                scrollbar = self.transcript_text.verticalScrollBar()
-                scrollbar.setValue(scrollbar.maximum())
+            if not text:
+                continue
+            if show_timestamps:
+                lines.append(f"[{segment.start_timestamp_simple}] {text}")
+            else:
+                lines.append(text)
+
+        if not lines:
+            return
+
+        self._last_rendered = None
+        cursor = self.transcript_text.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        if not self.transcript_text.document().isEmpty():
+            cursor.insertText("\n\n")
+        cursor.insertText("\n\n".join(lines))
+        cursor.endEditBlock()
+
+        # Follow the insert point; querying verticalScrollBar().maximum()
+        # would force a relayout just to compute the scroll target
+        self.transcript_text.setTextCursor(cursor)
+        self.transcript_text.ensureCursorVisible()
 
     def on_transcription_complete(self, video_item: VideoItem) -> None:
         """Handle transcription completion."""
@@ -591,14 +905,7 @@ class TranscriptPanel(QWidget):
             return
 
         format_idx = self.format_combo.currentIndex()
-        format_info = [
-            ("TXT", ".txt", TxtExporter),
-            ("SRT", ".srt", SrtExporter),
-            ("VTT", ".vtt", VttExporter),
-            ("JSON", ".json", JsonExporter),
-        ]
-
-        format_name, extension, exporter_class = format_info[format_idx]
+        format_name, extension, exporter_class = _FORMATS[format_idx]
 
         # Get save path - TXT with timestamps gets _timestamped suffix
         stem = self._current_video.file_path.stem
@@ -618,24 +925,62 @@ class TranscriptPanel(QWidget):
         if not file_path:
             return
 
-        try:
-            # For TXT format, respect the timestamp checkbox
-            if format_idx == self.FORMAT_TXT:
-                include_timestamps = self.show_timestamps_checkbox.isChecked()
-                exporter_class.export(self._current_video, Path(file_path), include_timestamps=include_timestamps)
-            else:
-                exporter_class.export(self._current_video, Path(file_path))
-            QMessageBox.information(
-                self,
-                "Export Successful",
-                f"Transcript exported to:\n{file_path}"
-            )
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Export Failed",
-                f"Failed to export transcript:\n{str(e)}"
-            )
+        video = self._current_video
+        target = Path(file_path)
+
+        # For TXT format, respect the timestamp checkbox
+        if format_idx == self.FORMAT_TXT:
+            include_timestamps = self.show_timestamps_checkbox.isChecked()
+
+            def do_export():
+                exporter_class.export(video, target, include_timestamps=include_timestamps)
+                return file_path
+        else:
+            def do_export():
+                exporter_class.export(video, target)
+                return file_path
+
+        self._start_export_task(do_export, self._on_export_finished)
+
+    def _start_export_task(self, fn, on_finished) -> None:
+        """Run an export callable on the global thread pool.
+
+        Writing a multi-hour transcript (JSON especially) can take
+        seconds; doing it inline froze the UI for the duration. The
+        export buttons stay disabled until the queued completion signal
+        lands back on the GUI thread.
+        """
+        self._set_export_busy(True)
+        task = _ExportTask(fn)
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(self._on_export_failed)
+        QThreadPool.globalInstance().start(task)
+
+    def _set_export_busy(self, busy: bool) -> None:
+        """Toggle the controls that must not run during an export."""
+        self.export_btn.setEnabled(not busy)
+        self.export_all_btn.setEnabled(not busy)
+        # Editing swaps segments out from under the exporting thread
+        self.edit_btn.setEnabled(not busy)
+        self.export_btn.setText("Exporting\u2026" if busy else "Export")
+
+    def _on_export_finished(self, file_path) -> None:
+        """Handle single-format export completion."""
+        self._set_export_busy(False)
+        QMessageBox.information(
+            self,
+            "Export Successful",
+            f"Transcript exported to:\n{file_path}"
+        )
+
+    def _on_export_failed(self, error: str) -> None:
+        """Handle export failure from the worker task."""
+        self._set_export_busy(False)
+        QMessageBox.critical(
+            self,
+            "Export Failed",
+            f"Failed to export transcript:\n{error}"
+        )
 
     def _on_export_all(self) -> None:
         """Export all formats (TXT, SRT, VTT, JSON) at once."""
@@ -658,11 +1003,9 @@ class TranscriptPanel(QWidget):
 
         # Build file list
         txt_name = f"{stem}_timestamped.txt" if include_timestamps else f"{stem}.txt"
-        files_to_export = [
-            (txt_name, TxtExporter, True),
-            (f"{stem}.srt", SrtExporter, False),
-            (f"{stem}.vtt", VttExporter, False),
-            (f"{stem}.json", JsonExporter, False),
+        files_to_export = [(txt_name, TxtExporter, True)] + [
+            (f"{stem}{extension}", exporter_class, False)
+            for _, extension, exporter_class in _FORMATS[1:]
         ]
 
         # Check for existing files
@@ -679,24 +1022,36 @@ class TranscriptPanel(QWidget):
             if reply == QMessageBox.StandardButton.No:
                 return
 
-        # Export all formats
-        exported = []
-        errors = []
-        for filename, exporter_class, is_txt in files_to_export:
-            file_path = dir_path / filename
-            try:
-                if is_txt:
-                    exporter_class.export(
-                        self._current_video, file_path,
-                        include_timestamps=include_timestamps
-                    )
-                else:
-                    exporter_class.export(self._current_video, file_path)
-                exported.append(filename)
-            except Exception as e:
-                errors.append(f"{filename}: {e}")
-
-        # Show summary
+        # Export all formats off the GUI thread; per-file failures are
+        # collected rather than raised so one bad format doesn't stop
+        # the rest
+        video = self._current_video
+
+        def do_export_all():
+            exported = []
+            errors = []
+            for filename, exporter_class, is_txt in files_to_export:
+                file_path = dir_path / filename
+                try:
+                    if is_txt:
+                        exporter_class.export(
+                            video, file_path,
+                            include_timestamps=include_timestamps
+                        )
+                    else:
+                        exporter_class.export(video, file_path)
+                    exported.append(filename)
+                except Exception as e:
+                    errors.append(f"{filename}: {e}")
+            return directory, exported, errors
+
+        self._start_export_task(do_export_all, self._on_export_all_finished)
+
+    def _on_export_all_finished(self, result) -> None:
+        """Show the export-all summary once the worker task reports in."""
+        self._set_export_busy(False)
+        directory, exported, errors = result
+
         if errors:
             msg = f"Exported {len(exported)} of 4 files to:\n{directory}\n\n"
             msg += "Errors:\n" + "\n".join(errors)
@@ -711,7 +1066,6 @@ class TranscriptPanel(QWidget):
         if not self._current_video or not self._current_video.is_transcribed:
             return
 
-        from PySide6.QtWidgets import QApplication
         clipboard = QApplication.clipboard()
         clipboard.setText(self.transcript_text.toPlainText())
 
@@ -721,7 +1075,6 @@ class TranscriptPanel(QWidget):
         self.copy_btn.setEnabled(False)
 
         # Reset after short delay
-        from PySide6.QtCore import QTimer
         QTimer.singleShot(1500, lambda: self._reset_copy_button(original_text))
 
     def _reset_copy_button(self, text: str) -> None:
@@ -739,6 +1092,8 @@ class TranscriptPanel(QWidget):
             self.transcript_text.setReadOnly(True)
 
         self._current_video = None
+        self._last_rendered = None
+        self._pending_segments.clear()
         self.video_name_label.setText("")
         self.transcript_text.clear()
         self.progress_group.hide()
@@ -1,10 +1,12 @@
 """Video list widget with drag-and-drop support."""
 
+import os
+import stat
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QDragEnterEvent, QDropEvent
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
+from PySide6.QtGui import QColor, QDragEnterEvent, QDropEvent, QPalette
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -17,11 +19,114 @@ from PySide6.QtWidgets import (
     QProgressBar,
     QMessageBox,
     QCheckBox,
+    QStyledItemDelegate,
 )
 
 from ..models.video_item import VideoItem, TranscriptionStatus
 from ..services.audio_extractor import AudioExtractor
 
+# Supported extensions (already lowercased) for the directory walk's
+# and drop handler's membership tests
+_MEDIA_EXTENSIONS = AudioExtractor.SUPPORTED_EXTENSIONS
+
+# QFileDialog filter string, assembled once at import rather than per
+# Add Files click; sorted so the dialog shows a stable glob order
+_VIDEO_GLOBS = " ".join(f"*{ext}" for ext in sorted(AudioExtractor.SUPPORTED_VIDEO_EXTENSIONS))
+_AUDIO_GLOBS = " ".join(f"*{ext}" for ext in sorted(AudioExtractor.SUPPORTED_AUDIO_EXTENSIONS))
+_FILE_FILTER = (
+    f"Media Files ({_VIDEO_GLOBS} {_AUDIO_GLOBS});;"
+    f"Video Files ({_VIDEO_GLOBS});;"
+    f"Audio Files ({_AUDIO_GLOBS});;"
+    "All Files (*)"
+)
+
+
+def _path_key(path: Path) -> str:
+    """Dictionary key for a path: absolute and case-normalized.
+
+    os.path.abspath is pure string work (one getcwd at most); unlike
+    Path.resolve it issues no lstat/readlink per component. The paths
+    here come from file dialogs, drops and directory walks, which hand
+    us concrete file locations — symlink canonicalization buys nothing
+    as a dedup key. normcase folds case on Windows without touching
+    the filesystem.
+    """
+    return os.path.normcase(os.path.abspath(str(path)))
+
+
+def _find_media_files(root: Path) -> list[Path]:
+    """Recursively collect supported media files under root.
+
+    A single os.walk pass with a set membership test per filename; the
+    previous per-extension rglob calls (two per extension for the case
+    variants) each re-walked the entire tree, and lowercasing the
+    suffix here makes the match case-insensitive for free.
+    """
+    found = []
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if os.path.splitext(name)[1].lower() in _MEDIA_EXTENSIONS:
+                found.append(Path(dirpath, name))
+    return found
+
+
+# Item data role carrying the TranscriptionStatus for the delegate
+_STATUS_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# Status icon prefixes, built once; TranscriptionStatus values are
+# strings, so this is keyed by the enum members themselves rather than
+# indexed by value
+_STATUS_ICONS = {
+    TranscriptionStatus.PENDING: "",
+    TranscriptionStatus.EXTRACTING: "[...] ",
+    TranscriptionStatus.TRANSCRIBING: "[>>>] ",
+    TranscriptionStatus.COMPLETED: "[OK] ",
+    TranscriptionStatus.ERROR: "[!] ",
+}
+
+
+class _VideoItemDelegate(QStyledItemDelegate):
+    """Paints list rows in their status color.
+
+    Reading the status from the model at paint time means a status
+    change costs one setData call; the per-item brush never has to be
+    touched and the color table is built once instead of per update.
+    """
+
+    _STATUS_COLORS = {
+        TranscriptionStatus.PENDING: QColor("#333333"),
+        TranscriptionStatus.EXTRACTING: QColor("#ff9800"),
+        TranscriptionStatus.TRANSCRIBING: QColor("#2196f3"),
+        TranscriptionStatus.COMPLETED: QColor("#4caf50"),
+        TranscriptionStatus.ERROR: QColor("#f44336"),
+    }
+
+    def initStyleOption(self, option, index) -> None:
+        super().initStyleOption(option, index)
+        color = self._STATUS_COLORS.get(index.data(_STATUS_ROLE))
+        if color is not None:
+            option.palette.setColor(QPalette.ColorRole.Text, color)
+
+
+class _ScanSignals(QObject):
+    """Signals for _ScanTask (QRunnable cannot carry signals itself)."""
+    finished = Signal(list)  # list[Path] of supported media files
+
+
+class _ScanTask(QRunnable):
+    """Walks directories for media files on a pool thread."""
+
+    def __init__(self, roots: list[Path]):
+        super().__init__()
+        self.signals = _ScanSignals()
+        self._roots = roots
+
+    def run(self) -> None:
+        found: list[Path] = []
+        for root in self._roots:
+            found.extend(_find_media_files(root))
+        self.signals.finished.emit(found)
+
 
 class VideoListWidget(QWidget):
     """
@@ -37,10 +142,52 @@ class VideoListWidget(QWidget):
     transcribe_requested = Signal(list)  # List of VideoItems
     transcribe_all_requested = Signal()
 
+    # Stylesheets as class constants: allocated once, not per instance
+    _LIST_STYLESHEET = """
+        QListWidget {
+            border: 2px dashed #ccc;
+            border-radius: 5px;
+            background-color: #fafafa;
+        }
+        QListWidget::item {
+            padding: 8px;
+            border-bottom: 1px solid #eee;
+        }
+        QListWidget::item:selected {
+            background-color: #e3f2fd;
+            color: #1976d2;
+        }
+        QListWidget::item:hover {
+            background-color: #f5f5f5;
+        }
+    """
+
+    _TRANSCRIBE_BTN_STYLESHEET = """
+        QPushButton {
+            background-color: #1976d2;
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+        }
+        QPushButton:hover {
+            background-color: #1565c0;
+        }
+        QPushButton:disabled {
+            background-color: #ccc;
+        }
+    """
+
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize the video list widget."""
         super().__init__(parent)
         self._video_items: dict[str, VideoItem] = {}  # path -> VideoItem
+        # id(VideoItem) -> its QListWidgetItem, so status updates don't
+        # rescan every row
+        self._row_by_item: dict[int, QListWidgetItem] = {}
+        # id(QListWidgetItem) -> path key, so selection handlers stay on
+        # the Python side instead of unwrapping a QVariant per item
+        self._item_to_path: dict[int, str] = {}
         self._setup_ui()
         self._connect_signals()
 
@@ -66,25 +213,9 @@ class VideoListWidget(QWidget):
         self.list_widget.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
         self.list_widget.setMinimumWidth(250)
 
-        # Placeholder text
-        self.list_widget.setStyleSheet("""
-            QListWidget {
-                border: 2px dashed #ccc;
-                border-radius: 5px;
-                background-color: #fafafa;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #eee;
-            }
-            QListWidget::item:selected {
-                background-color: #e3f2fd;
-                color: #1976d2;
-            }
-            QListWidget::item:hover {
-                background-color: #f5f5f5;
-            }
-        """)
+        self.list_widget.setStyleSheet(self._LIST_STYLESHEET)
+
+        self.list_widget.setItemDelegate(_VideoItemDelegate(self.list_widget))
 
         layout.addWidget(self.list_widget)
 
@@ -119,21 +250,7 @@ class VideoListWidget(QWidget):
 
         self.transcribe_btn = QPushButton("Transcribe Selected")
         self.transcribe_btn.setEnabled(False)
-        self.transcribe_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1976d2;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #1565c0;
-            }
-            QPushButton:disabled {
-                background-color: #ccc;
-            }
-        """)
+        self.transcribe_btn.setStyleSheet(self._TRANSCRIBE_BTN_STYLESHEET)
         action_layout.addWidget(self.transcribe_btn)
 
         self.clear_btn = QPushButton("Clear")
@@ -163,38 +280,37 @@ class VideoListWidget(QWidget):
         """Handle drop events."""
         urls = event.mimeData().urls()
         paths = []
+        folders = []
 
         for url in urls:
             path = Path(url.toLocalFile())
-            if path.is_file() and AudioExtractor.is_supported_file(path):
+            # One stat per URL classifies it; is_file/is_dir would each
+            # stat again (and vanished entries just get skipped)
+            try:
+                mode = path.stat().st_mode
+            except OSError:
+                continue
+            if stat.S_ISDIR(mode):
+                folders.append(path)
+            elif stat.S_ISREG(mode) and path.suffix.lower() in _MEDIA_EXTENSIONS:
                 paths.append(path)
-            elif path.is_dir():
-                # Recursively find videos in directory (case-insensitive)
-                for ext in AudioExtractor.SUPPORTED_VIDEO_EXTENSIONS:
-                    paths.extend(path.rglob(f"*{ext}"))
-                    paths.extend(path.rglob(f"*{ext.upper()}"))
-                for ext in AudioExtractor.SUPPORTED_AUDIO_EXTENSIONS:
-                    paths.extend(path.rglob(f"*{ext}"))
-                    paths.extend(path.rglob(f"*{ext.upper()}"))
-
-        # Remove duplicates
-        paths = list(set(paths))
-        self._add_video_paths(paths)
+
+        if paths:
+            self._add_video_paths(paths)
+        if folders:
+            # Walking a large dropped tree inline would freeze the
+            # event loop; scan it on the pool and add the results when
+            # the finished signal lands back on the GUI thread
+            self._start_scan(folders, notify_empty=False)
         event.acceptProposedAction()
 
     def _on_add_files(self) -> None:
         """Handle add files button click."""
-        # Build file filter
-        video_exts = " ".join(f"*{ext}" for ext in AudioExtractor.SUPPORTED_VIDEO_EXTENSIONS)
-        audio_exts = " ".join(f"*{ext}" for ext in AudioExtractor.SUPPORTED_AUDIO_EXTENSIONS)
-
-        file_filter = f"Media Files ({video_exts} {audio_exts});;Video Files ({video_exts});;Audio Files ({audio_exts});;All Files (*)"
-
         paths, _ = QFileDialog.getOpenFileNames(
             self,
             "Select Video Files",
             "",
-            file_filter
+            _FILE_FILTER
         )
 
         if paths:
@@ -210,74 +326,65 @@ class VideoListWidget(QWidget):
         )
 
         if folder:
-            folder_path = Path(folder)
-            paths = []
-
-            # Search for both lowercase and uppercase extensions
-            for ext in AudioExtractor.SUPPORTED_VIDEO_EXTENSIONS:
-                paths.extend(folder_path.rglob(f"*{ext}"))
-                paths.extend(folder_path.rglob(f"*{ext.upper()}"))
-            for ext in AudioExtractor.SUPPORTED_AUDIO_EXTENSIONS:
-                paths.extend(folder_path.rglob(f"*{ext}"))
-                paths.extend(folder_path.rglob(f"*{ext.upper()}"))
-
-            # Remove duplicates (in case filesystem is case-insensitive)
-            paths = list(set(paths))
-
-            if paths:
-                self._add_video_paths(paths)
-            else:
-                QMessageBox.information(
-                    self,
-                    "No Videos Found",
-                    "No supported video files were found in the selected folder."
-                )
+            self._start_scan([Path(folder)], notify_empty=True)
+
+    def _start_scan(self, roots: list[Path], notify_empty: bool) -> None:
+        """Walk the given directories on the global thread pool."""
+        task = _ScanTask(roots)
+        task.signals.finished.connect(
+            self._on_scan_finished if notify_empty else self._add_video_paths
+        )
+        QThreadPool.globalInstance().start(task)
+
+    def _on_scan_finished(self, paths: list) -> None:
+        """Add scanned paths, telling the user when nothing was found."""
+        if paths:
+            self._add_video_paths(paths)
+        else:
+            QMessageBox.information(
+                self,
+                "No Videos Found",
+                "No supported video files were found in the selected folder."
+            )
 
     def _add_video_paths(self, paths: list[Path]) -> None:
         """Add video paths to the list."""
         added_count = 0
-        for path in paths:
-            path_str = str(path.resolve())
-            if path_str not in self._video_items:
-                video_item = VideoItem.from_path(path)
-                self._video_items[path_str] = video_item
-                self._add_list_item(video_item)
-                added_count += 1
+        # One relayout and paint for the whole batch instead of a view
+        # update (and possible selection signal) per appended row
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+        try:
+            for path in paths:
+                path_str = _path_key(path)
+                if path_str not in self._video_items:
+                    video_item = VideoItem.from_path(path)
+                    self._video_items[path_str] = video_item
+                    self._add_list_item(video_item, path_str)
+                    added_count += 1
+        finally:
+            self.list_widget.blockSignals(False)
+            self.list_widget.setUpdatesEnabled(True)
 
         if added_count > 0:
             self._update_ui_state()
 
-    def _add_list_item(self, video_item: VideoItem) -> None:
+    def _add_list_item(self, video_item: VideoItem, path_str: str) -> None:
         """Add a VideoItem to the list widget."""
         item = QListWidgetItem(video_item.filename)
-        item.setData(Qt.ItemDataRole.UserRole, str(video_item.file_path.resolve()))
         item.setToolTip(str(video_item.file_path))
         self._update_item_status(item, video_item)
         self.list_widget.addItem(item)
+        self._row_by_item[id(video_item)] = item
+        self._item_to_path[id(item)] = path_str
 
     def _update_item_status(self, item: QListWidgetItem, video_item: VideoItem) -> None:
         """Update the visual status of a list item."""
-        status_icons = {
-            TranscriptionStatus.PENDING: "",
-            TranscriptionStatus.EXTRACTING: "[...] ",
-            TranscriptionStatus.TRANSCRIBING: "[>>>] ",
-            TranscriptionStatus.COMPLETED: "[OK] ",
-            TranscriptionStatus.ERROR: "[!] ",
-        }
-
-        status_colors = {
-            TranscriptionStatus.PENDING: "#333",
-            TranscriptionStatus.EXTRACTING: "#ff9800",
-            TranscriptionStatus.TRANSCRIBING: "#2196f3",
-            TranscriptionStatus.COMPLETED: "#4caf50",
-            TranscriptionStatus.ERROR: "#f44336",
-        }
-
-        icon = status_icons.get(video_item.status, "")
-        color = status_colors.get(video_item.status, "#333")
+        icon = _STATUS_ICONS.get(video_item.status, "")
 
         item.setText(f"{icon}{video_item.filename}")
-        item.setForeground(Qt.GlobalColor.black)
+        # The delegate reads this role at paint time and colors the row
+        item.setData(_STATUS_ROLE, video_item.status)
 
     def _on_transcribe(self) -> None:
         """Handle transcribe button click."""
@@ -289,6 +396,8 @@ class VideoListWidget(QWidget):
         """Handle clear button click."""
         self.list_widget.clear()
         self._video_items.clear()
+        self._row_by_item.clear()
+        self._item_to_path.clear()
         self._update_ui_state()
 
     def _on_selection_changed(self) -> None:
@@ -298,7 +407,7 @@ class VideoListWidget(QWidget):
 
     def _on_item_clicked(self, item: QListWidgetItem) -> None:
         """Handle item click."""
-        path_str = item.data(Qt.ItemDataRole.UserRole)
+        path_str = self._item_to_path.get(id(item))
         if path_str and path_str in self._video_items:
             self.video_selected.emit(self._video_items[path_str])
 
@@ -311,27 +420,46 @@ class VideoListWidget(QWidget):
         """Get the currently selected VideoItems."""
         items = []
         for list_item in self.list_widget.selectedItems():
-            path_str = list_item.data(Qt.ItemDataRole.UserRole)
+            path_str = self._item_to_path.get(id(list_item))
             if path_str and path_str in self._video_items:
                 items.append(self._video_items[path_str])
         return items
 
-    def get_all_video_items(self) -> list[VideoItem]:
-        """Get all VideoItems in the list."""
-        return list(self._video_items.values())
+    def get_all_video_items(self) -> Iterable[VideoItem]:
+        """Get all VideoItems in the list.
+
+        Returns the live dict view — no per-call copy. Callers that
+        add or remove videos while iterating should take their own
+        list() snapshot first.
+        """
+        return self._video_items.values()
 
     def update_video_status(self, video_item: VideoItem) -> None:
         """Update the display status of a video item."""
-        path_str = str(video_item.file_path.resolve())
-
-        # Find the list item
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item.data(Qt.ItemDataRole.UserRole) == path_str:
-                self._update_item_status(item, video_item)
-                break
+        item = self._row_by_item.get(id(video_item))
+        if item is not None:
+            self._update_item_status(item, video_item)
+
+    def update_many(self, video_items: list[VideoItem]) -> None:
+        """
+        Update the display status of several video items at once.
+
+        Suspends list repaints for the duration, so a bulk refresh costs
+        a single relayout instead of one view update per item.
+        """
+        if not video_items:
+            return
+
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            for video_item in video_items:
+                item = self._row_by_item.get(id(video_item))
+                if item is not None:
+                    self._update_item_status(item, video_item)
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
 
     def get_video_item(self, path: Path | str) -> Optional[VideoItem]:
         """Get a VideoItem by its path."""
-        path_str = str(Path(path).resolve())
+        path_str = _path_key(Path(path))
         return self._video_items.get(path_str)